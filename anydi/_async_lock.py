@@ -1,27 +1,28 @@
 from types import TracebackType
 from typing import Any
 
-import anyio
 from typing_extensions import Self
 
+from ._backend import create_lock, current_task
+
 
 class AsyncRLock:
     def __init__(self) -> None:
-        self._lock = anyio.Lock()
-        self._owner: anyio.TaskInfo | None = None
+        self._lock = create_lock()
+        self._owner: object = None
         self._count = 0
 
     async def acquire(self) -> None:
-        current_task = anyio.get_current_task()
-        if self._owner == current_task:
+        task = current_task()
+        if self._owner == task:
             self._count += 1
         else:
             await self._lock.acquire()
-            self._owner = current_task
+            self._owner = task
             self._count = 1
 
     def release(self) -> None:
-        if self._owner != anyio.get_current_task():
+        if self._owner != current_task():
             raise RuntimeError("Lock can only be released by the owner")
         self._count -= 1
         if self._count == 0:
@@ -0,0 +1,117 @@
+"""Async backend helpers with an asyncio fast path."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+
+T = TypeVar("T")
+
+
+def get_running_loop() -> asyncio.AbstractEventLoop | None:
+    """Get the running asyncio event loop, or None on other backends."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def is_asyncio() -> bool:
+    """Check if the current task runs on an asyncio event loop."""
+    return get_running_loop() is not None
+
+
+def current_task() -> object:
+    """Get an identity of the current task.
+
+    On asyncio this is the task object itself, which avoids building the
+    ``anyio.TaskInfo`` wrapper on every call. Other backends go through anyio.
+    """
+    if get_running_loop() is not None:
+        return asyncio.current_task()
+    return anyio.get_current_task()
+
+
+def create_lock() -> asyncio.Lock | anyio.Lock:
+    """Create a lock for the backend of the running event loop."""
+    if get_running_loop() is not None:
+        return asyncio.Lock()
+    return anyio.Lock()
+
+
+async def run_sync(
+    func: Callable[..., T], *args: Any, abandon_on_cancel: bool = False
+) -> T:
+    """Run a sync function in a worker thread.
+
+    On asyncio the call goes straight to the loop's default executor with the
+    current context copied, so context variables behave as with anyio. Like
+    anyio, a cancelled caller still waits for the worker thread to finish,
+    unless `abandon_on_cancel` is set, in which case the thread is left running.
+    """
+    loop = get_running_loop()
+    if loop is None:
+        if abandon_on_cancel:
+            return await anyio.to_thread.run_sync(func, *args, abandon_on_cancel=True)
+        return await anyio.to_thread.run_sync(func, *args)
+
+    context = contextvars.copy_context()
+    future = loop.run_in_executor(None, functools.partial(context.run, func, *args))
+    if abandon_on_cancel:
+        return await future  # type: ignore[reportReturnType]
+    try:
+        return await asyncio.shield(future)  # type: ignore[reportReturnType]
+    except asyncio.CancelledError:
+        # A cancel scope keeps cancelling the task until it exits the scope
+        while not future.done():
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.wait((future,))
+        raise
+
+
+class ThreadsafeEvent:
+    """An event that is awaited in an event loop and can be set from any thread.
+
+    The event is bound to the loop it is created in. Setting it schedules the
+    wake-up on that loop, so waiting does not occupy a worker thread.
+    """
+
+    __slots__ = ("_event", "_notify")
+
+    def __init__(self) -> None:
+        loop = get_running_loop()
+        if loop is not None:
+            event = asyncio.Event()
+            self._event: asyncio.Event | anyio.Event = event
+
+            def notify() -> None:
+                with contextlib.suppress(RuntimeError):  # The loop is closed
+                    loop.call_soon_threadsafe(event.set)
+
+        else:
+            import trio
+
+            anyio_event = anyio.Event()
+            self._event = anyio_event
+            token = trio.lowlevel.current_trio_token()
+
+            def notify() -> None:
+                with contextlib.suppress(trio.RunFinishedError):
+                    token.run_sync_soon(anyio_event.set)
+
+        self._notify = notify
+
+    def set(self) -> None:
+        """Set the event, safe to call from any thread."""
+        self._notify()
+
+    async def wait(self) -> None:
+        """Wait until the event is set."""
+        await self._event.wait()
@@ -1,43 +1,118 @@
 """AnyDI CLI module."""
 
+from __future__ import annotations
+
 import argparse
 import sys
+from pathlib import Path
 
-from anydi import import_container
+from anydi import Container, import_container
 
 
 def main() -> None:
     """CLI entry point."""
-    parser = argparse.ArgumentParser(description="AnyDI CLI")
-    parser.add_argument(
+    parser = argparse.ArgumentParser(prog="anydi", description="AnyDI CLI")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    graph_parser = commands.add_parser(
+        "graph",
+        help="Print the dependency graph (default command)",
+        description="Print the dependency graph of a container",
+    )
+    graph_parser.add_argument(
         "container",
         help="Path to the container instance or factory (e.g., 'module:container')",
     )
-    parser.add_argument(
-        "--app-dir",
-        default="",
-        help="Look for APP in the specified directory, by adding this to the "
-        "PYTHONPATH. Defaults to the current working directory.",
-    )
-    parser.add_argument(
+    _add_common_arguments(graph_parser)
+    graph_parser.add_argument(
         "--output-format",
         "-o",
         choices=["tree", "mermaid", "dot", "json"],
         default="tree",
         help="Output format for the dependency graph",
     )
-    parser.add_argument(
+    graph_parser.add_argument(
         "--full-path",
         action="store_true",
         help="Show full module path for dependencies",
     )
-    parser.add_argument(
+    graph_parser.add_argument(
         "--indent",
         "-i",
         type=int,
         default=2,
         help="JSON indentation level",
     )
+    graph_parser.set_defaults(handler=_graph)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="Generate a Python module with static resolvers",
+        description="Generate a Python module with static resolvers",
+    )
+    compile_parser.add_argument(
+        "container",
+        help="Path to the container instance or factory (e.g., 'module:container')",
+    )
+    _add_common_arguments(compile_parser)
+    compile_parser.add_argument(
+        "--output",
+        "-o",
+        help="Write the module to the specified file instead of stdout",
+    )
+    compile_parser.set_defaults(handler=_compile)
+
+    argv = sys.argv[1:]
+    # `anydi PATH` is short for `anydi graph PATH`
+    if argv and argv[0] not in commands.choices and argv[0] not in ("-h", "--help"):
+        argv = ["graph", *argv]
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+def _graph(args: argparse.Namespace) -> None:
+    """Print the dependency graph of a container."""
+    container = _load_container(args)
+
+    try:
+        graph_out = container.graph(
+            output_format=args.output_format,
+            full_path=args.full_path,
+            ident=args.indent,
+        )
+    except (LookupError, ValueError, TypeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+
+    print(graph_out)  # noqa: T201
+
+
+def _compile(args: argparse.Namespace) -> None:
+    """Export the resolvers of a container as a Python module."""
+    container = _load_container(args)
+
+    try:
+        if not container.ready:
+            container.build()
+        module_out = container.export_resolvers(title=args.container)
+    except (LookupError, ValueError, TypeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(module_out)
+    else:
+        print(module_out)  # noqa: T201
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--app-dir",
+        default="",
+        help="Look for APP in the specified directory, by adding this to the "
+        "PYTHONPATH. Defaults to the current working directory.",
+    )
     parser.add_argument(
         "--scan",
         "-s",
@@ -45,8 +120,8 @@ def main() -> None:
         help="Packages or modules to scan for dependencies",
     )
 
-    args = parser.parse_args()
 
+def _load_container(args: argparse.Namespace) -> Container:
     if args.app_dir is not None:
         sys.path.insert(0, args.app_dir)
 
@@ -63,17 +138,7 @@ def main() -> None:
             print(f"Error scanning packages: {exc}", file=sys.stderr)  # noqa: T201
             sys.exit(1)
 
-    try:
-        graph_out = container.graph(
-            output_format=args.output_format,
-            full_path=args.full_path,
-            ident=args.indent,
-        )
-    except (LookupError, ValueError, TypeError) as exc:
-        print(f"Error: {exc}", file=sys.stderr)  # noqa: T201
-        sys.exit(1)
-
-    print(graph_out)  # noqa: T201
+    return container
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+"""Persistent cache of generated resolver code objects."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import importlib.util
+import marshal
+import os
+import sys
+from pathlib import Path
+from types import CodeType
+
+CODE_CACHE_PREFIX = "anydi-"
+CODE_CACHE_SUFFIX = ".marshal"
+
+
+def get_anydi_version() -> str:
+    """Get the installed anydi version."""
+    try:
+        return importlib.metadata.version("anydi")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def source_digest(src: str, filename: str) -> str:
+    """Get the cache key of a generated source."""
+    return hashlib.sha256(f"{filename}\n{src}".encode()).hexdigest()
+
+
+class CodeCache:
+    """Stores compiled resolver code objects on disk in marshal format.
+
+    The cache file is keyed by a fingerprint of the provider graph, the Python
+    version and the anydi version. Entries inside the file are keyed by a digest
+    of the generated source, so a stale entry can never be reused for a
+    different resolver.
+    """
+
+    __slots__ = ("_directory", "_path", "_codes", "_dirty")
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self._directory = Path(directory)
+        self._path: Path | None = None
+        self._codes: dict[str, CodeType] = {}
+        self._dirty = False
+
+    @property
+    def path(self) -> Path | None:
+        """Get the path of the loaded cache file."""
+        return self._path
+
+    def load(self, graph_fingerprint: str) -> None:
+        """Load the cache file that matches the provider graph fingerprint."""
+        key = hashlib.sha256(
+            "\n".join(
+                (
+                    graph_fingerprint,
+                    sys.version,
+                    importlib.util.MAGIC_NUMBER.hex(),
+                    get_anydi_version(),
+                )
+            ).encode()
+        ).hexdigest()[:32]
+        self._path = self._directory / f"{CODE_CACHE_PREFIX}{key}{CODE_CACHE_SUFFIX}"
+        self._codes = {}
+        self._dirty = False
+
+        try:
+            data = marshal.loads(self._path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+
+        if isinstance(data, dict):
+            self._codes = {
+                digest: code
+                for digest, code in data.items()  # type: ignore[reportUnknownVariableType]
+                if isinstance(digest, str) and isinstance(code, CodeType)
+            }
+
+    def compile(self, src: str, filename: str, digest: str) -> CodeType:
+        """Get the code object for a generated source, compiling it if needed."""
+        code = self._codes.get(digest)
+        if code is None:
+            code = compile(src, filename, "exec")
+            self._codes[digest] = code
+            self._dirty = True
+        return code
+
+    def save(self) -> bool:
+        """Write new entries to disk, returning True if the file was updated."""
+        if self._path is None or not self._dirty:
+            return False
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(marshal.dumps(self._codes))
+        os.replace(tmp_path, self._path)
+        self._dirty = False
+        return True
@@ -6,34 +6,58 @@ import contextlib
 import importlib
 import inspect
 import logging
+import os
+import threading
+import time
 import types
 import uuid
 import warnings
 from collections import defaultdict
-from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
 from typing import Any, Literal, TypeVar, get_args, get_origin, overload
 
+import anyio
+from anyio.abc import TaskStatus
 from typing_extensions import ParamSpec, Self, type_repr
 
-from ._context import InstanceContext
+from ._code_cache import CodeCache
+from ._context import (
+    AsyncScopedContext,
+    ContextPool,
+    InstanceContext,
+    ScopedContext,
+    SlotTable,
+)
 from ._decorators import is_provided
 from ._graph import Graph
 from ._injector import Injector
 from ._marker import Marker
 from ._module import ModuleDef, ModuleRegistrar
 from ._provider import Provider, ProviderDef, ProviderKind, ProviderParameter
-from ._resolver import Resolver
+from ._resolver import CompiledResolver, ResolvePlan, Resolver, gather
 from ._scanner import PackageOrIterable, Scanner
+from ._shutdown import ShutdownReport, close_resources
 from ._types import (
     NOT_SET,
+    DependencyKey,
     Event,
     Scope,
+    intern_key,
     is_event_type,
     is_iterator_type,
     is_none_type,
     to_list,
 )
+from ._warmup import Warmup
 
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
@@ -48,6 +72,11 @@ class Container:
         providers: Iterable[ProviderDef] | None = None,
         modules: Iterable[ModuleDef] | None = None,
         logger: logging.Logger | None = None,
+        flatten_resolvers: bool = False,
+        fold_singletons: bool = False,
+        concurrent_resolution: bool = False,
+        code_cache_dir: str | os.PathLike[str] | None = None,
+        context_pool_size: int = 0,
     ) -> None:
         self._providers: dict[Any, Provider] = {}
         self._logger = logger or logging.getLogger(__name__)
@@ -58,11 +87,21 @@ class Container:
 
         self._resources: dict[str, list[Any]] = defaultdict(list)
         self._aliases: dict[Any, Any] = {}  # alias_type → canonical_type
-        self._singleton_context = InstanceContext()
+        self._slot_tables: dict[str, SlotTable] = {"singleton": SlotTable()}
+        self._singleton_context = InstanceContext(self._slot_tables["singleton"])
         self._scoped_context: dict[str, ContextVar[InstanceContext]] = {}
+        self._scope_events: dict[str, tuple[Any, ...]] = {}
+        self._context_pool_size = context_pool_size
+        self._context_pools: dict[str, ContextPool] = {}
 
         # Components
-        self._resolver = Resolver(self)
+        self._resolver = Resolver(
+            self,
+            flatten=flatten_resolvers,
+            fold_singletons=fold_singletons,
+            concurrent=concurrent_resolution,
+            code_cache=CodeCache(code_cache_dir) if code_cache_dir else None,
+        )
         self._injector = Injector(self)
         self._modules = ModuleRegistrar(self)
         self._scanner = Scanner(self)
@@ -70,6 +109,10 @@ class Container:
 
         # Build state
         self._ready = False
+        self._precompile_duration: float | None = None
+        self._precompiled = threading.Event()
+        self._precompiled.set()
+        self._plans: dict[tuple[tuple[Any, ...], bool], ResolvePlan] = {}
 
         # Test mode (enables override support for all resolutions)
         self._test_mode = False
@@ -135,11 +178,59 @@ class Container:
         """Exit the singleton context."""
         return self._singleton_context.__exit__(exc_type, exc_val, exc_tb)
 
-    def start(self) -> None:
-        """Start the singleton context."""
-        # Resolve all singleton resources
-        for dependency_type in self._resources.get("singleton", []):
-            self.resolve(dependency_type)
+    def start(self, *, max_workers: int | None = None) -> None:
+        """Start the singleton context.
+
+        With `max_workers`, singleton resources are started in waves, see
+        `_get_start_waves`, and the resources of a wave are started in a thread
+        pool. Their teardowns are registered in the order the resources were
+        registered, so they close in the same order on every run.
+        If a resource fails to start, the already started ones are closed.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("The `max_workers` must be greater than 0.")
+
+        try:
+            if max_workers is None or max_workers == 1:
+                for dependency_type in self._resources.get("singleton", []):
+                    self.resolve(dependency_type)
+            else:
+                self._start_in_threads(max_workers)
+        except BaseException:
+            self.close()
+            raise
+
+    def _start_in_threads(self, max_workers: int) -> None:
+        """Start the waves of singleton resources in a thread pool."""
+        context = self._singleton_context
+
+        def start_resource(dependency_type: Any) -> contextlib.ExitStack:
+            with context.capture() as stack:
+                try:
+                    self.resolve(dependency_type)
+                except BaseException:
+                    stack.close()
+                    raise
+            return stack
+
+        with ThreadPoolExecutor(
+            max_workers, thread_name_prefix="anydi-start"
+        ) as executor:
+            for wave in self._get_start_waves():
+                if len(wave) == 1:
+                    self.resolve(wave[0])
+                    continue
+                futures = [executor.submit(start_resource, t) for t in wave]
+                error: BaseException | None = None
+                for future in futures:
+                    try:
+                        stack = future.result()
+                    except BaseException as exc:
+                        error = error or exc
+                    else:
+                        context.enter(stack)
+                if error is not None:
+                    raise error
 
     def close(self) -> None:
         """Close the singleton context."""
@@ -157,80 +248,152 @@ class Container:
         exc_tb: types.TracebackType | None,
     ) -> bool:
         """Exit the singleton context."""
+        if exc_type is None:
+            await self.aclose()
+            return False
         return await self._singleton_context.__aexit__(exc_type, exc_val, exc_tb)
 
-    async def astart(self) -> None:
-        """Start the singleton context asynchronously."""
-        for dependency_type in self._resources.get("singleton", []):
-            await self.aresolve(dependency_type)
-
-    async def aclose(self) -> None:
-        """Close the singleton context asynchronously."""
-        await self._singleton_context.aclose()
+    async def astart(self, *, concurrent: bool = False) -> None:
+        """Start the singleton context asynchronously.
 
-    @contextlib.contextmanager
-    def scoped_context(self, scope: str) -> Iterator[InstanceContext]:
-        """Obtain a context manager for the request-scoped context."""
-        context_var = self._get_scoped_context_var(scope)
-
-        # Check if context already exists (re-entering same scope)
-        context = context_var.get(None)
-        if context is not None:
-            # Reuse existing context, don't create a new one
-            yield context
-            return
-
-        # Create new context
-        context = InstanceContext()
-        token = context_var.set(context)
-
-        # Resolve all request resources
-        for dependency_type in self._resources.get(scope, []):
-            if not is_event_type(dependency_type):
-                continue
-            self.resolve(dependency_type)
-
-        with context:
-            yield context
-            context_var.reset(token)
+        With `concurrent`, singleton resources are started in waves, see
+        `_get_start_waves`. Resources of a wave are independent of each other and
+        start concurrently in child tasks, so they must not hold cancel scopes or
+        task groups across `yield`. If a resource fails to start, the already
+        started ones are closed.
+        """
+        try:
+            if concurrent:
+                for wave in self._get_start_waves():
+                    await self.aresolve_many(wave)
+            else:
+                for dependency_type in self._resources.get("singleton", []):
+                    await self.aresolve(dependency_type)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await self.aclose()
+            raise
+
+    def _get_start_waves(
+        self, dependency_types: Sequence[Any] | None = None
+    ) -> list[list[Any]]:
+        """Group the singleton resources into waves in dependency order.
+
+        A resource is placed in the wave right after the last resource it depends
+        on, directly or through other providers. Resources keep their registration
+        order within a wave. With `dependency_types`, those are grouped instead
+        of the registered resources.
+        """
+        if dependency_types is None:
+            dependency_types = self._resources.get("singleton", [])
+        members = set(dependency_types)
+        heights: dict[Any, int] = {}
+
+        def get_height(dependency_type: Any) -> int:
+            # Number of waves needed to start the resources of the subgraph
+            height = heights.get(dependency_type)
+            if height is not None:
+                return height
+            heights[dependency_type] = 0  # Guards against cycles before build()
+            provider = self._providers.get(self._resolve_alias(dependency_type))
+            if provider is None:
+                return 0
+            height = max(
+                (get_height(param.dependency_type) for param in provider.parameters),
+                default=0,
+            )
+            if provider.dependency_type in members:
+                height += 1
+            heights[dependency_type] = height
+            return height
+
+        waves: list[list[Any]] = []
+        for dependency_type in dependency_types:
+            wave = get_height(dependency_type) - 1
+            while len(waves) <= wave:
+                waves.append([])
+            waves[wave].append(dependency_type)
+        return [wave for wave in waves if wave]
+
+    async def aclose(
+        self,
+        *,
+        concurrent: bool = False,
+        timeout: float | None = None,
+        timeouts: Mapping[Any, float] | None = None,
+    ) -> ShutdownReport:
+        """Close the singleton context asynchronously.
+
+        Singletons entered as context managers are closed in the calling task,
+        in the reverse order they were entered. With `concurrent`, they are
+        grouped into waves like the start waves and closed wave by wave in
+        reverse order, the resources of a wave concurrently in child tasks.
+        The `timeout` limits the whole shutdown, `timeouts` sets deadlines for
+        single dependency types. Resources that time out are abandoned, logged
+        and reported.
+        """
+        context = self._singleton_context
+        stacks = context.take_resources()
+        dependency_types = [
+            key.dependency_type if isinstance(key, DependencyKey) else key
+            for key in stacks
+        ]
+        if concurrent:
+            waves = self._get_start_waves(dependency_types)
+        else:
+            waves = [[dependency_type] for dependency_type in dependency_types]
+        report = await close_resources(
+            context,
+            stacks,
+            waves,
+            timeout=timeout,
+            timeouts=timeouts,
+        )
+        for dependency_type in report.timed_out:
+            self._logger.warning(
+                "Timed out closing resource `%s`.", type_repr(dependency_type)
+            )
+        return report
 
-    @contextlib.asynccontextmanager
-    async def ascoped_context(self, scope: str) -> AsyncIterator[InstanceContext]:
+    def scoped_context(self, scope: str) -> ScopedContext:
         """Obtain a context manager for the specified scoped context."""
-        context_var = self._get_scoped_context_var(scope)
-
-        # Check if context already exists (re-entering same scope)
-        context = context_var.get(None)
-        if context is not None:
-            # Reuse existing context, don't create a new one
-            yield context
-            return
-
-        # Create new context
-        context = InstanceContext()
-        token = context_var.set(context)
-
-        # Resolve all request resources
-        for dependency_type in self._resources.get(scope, []):
-            if not is_event_type(dependency_type):
-                continue
-            await self.aresolve(dependency_type)
+        return ScopedContext(
+            self,
+            self._get_scoped_context_var(scope),
+            self._slot_tables[scope],
+            self._context_pools.get(scope),
+            self._get_scope_events(scope),
+        )
 
-        async with context:
-            yield context
-            context_var.reset(token)
+    def ascoped_context(self, scope: str) -> AsyncScopedContext:
+        """Obtain an async context manager for the specified scoped context."""
+        return AsyncScopedContext(
+            self,
+            self._get_scoped_context_var(scope),
+            self._slot_tables[scope],
+            self._context_pools.get(scope),
+            self._get_scope_events(scope),
+        )
 
-    @contextlib.contextmanager
-    def request_context(self) -> Iterator[InstanceContext]:
+    def request_context(self) -> ScopedContext:
         """Obtain a context manager for the request-scoped context."""
-        with self.scoped_context("request") as context:
-            yield context
+        return self.scoped_context("request")
 
-    @contextlib.asynccontextmanager
-    async def arequest_context(self) -> AsyncIterator[InstanceContext]:
+    def arequest_context(self) -> AsyncScopedContext:
         """Obtain an async context manager for the request-scoped context."""
-        async with self.ascoped_context("request") as context:
-            yield context
+        return self.ascoped_context("request")
+
+    def _get_scope_events(self, scope: str) -> tuple[Any, ...]:
+        """Get the event resources started when a context of the scope opens."""
+        events = self._scope_events.get(scope)
+        if events is None:
+            events = tuple(
+                dependency_type
+                for dependency_type in self._resources.get(scope, [])
+                if is_event_type(dependency_type)
+            )
+            self._scope_events[scope] = events
+        return events
 
     def _get_scoped_context(self, scope: str) -> InstanceContext:
         scoped_context_var = self._get_scoped_context_var(scope)
@@ -291,6 +454,11 @@ class Container:
 
         # Register the scope
         self._scopes[scope] = tuple({scope, "singleton"} | set(parents))
+        self._slot_tables[scope] = SlotTable()
+        if self._context_pool_size > 0:
+            self._context_pools[scope] = ContextPool(
+                self._slot_tables[scope], self._context_pool_size
+            )
 
     def has_scope(self, scope: str) -> bool:
         """Check if a scope is registered."""
@@ -437,6 +605,8 @@ class Container:
                 pass
             else:
                 del context[dependency_type]
+                if provider.scope == "singleton":
+                    self._resolver.invalidate_dependents(dependency_type)
 
         # Cleanup provider references
         self._delete_provider(provider)
@@ -824,8 +994,13 @@ class Container:
     def _set_provider(self, provider: Provider) -> None:
         """Set a provider by dependency type."""
         self._providers[provider.dependency_type] = provider
+        if provider.scope != "transient":
+            self._slot_tables[provider.scope].slot_for(
+                intern_key(provider.dependency_type)
+            )
         if provider.is_resource:
             self._resources[provider.scope].append(provider.dependency_type)
+            self._scope_events.pop(provider.scope, None)
 
     def _delete_provider(self, provider: Provider) -> None:
         """Delete a provider."""
@@ -833,6 +1008,7 @@ class Container:
             del self._providers[provider.dependency_type]
         if provider.is_resource:
             self._resources[provider.scope].remove(provider.dependency_type)
+            self._scope_events.pop(provider.scope, None)
 
     # == Instance Resolution ==
 
@@ -844,12 +1020,9 @@ class Container:
 
     def resolve(self, dependency_type: type[T], /) -> T:
         """Resolve an instance by dependency type using compiled sync resolver."""
-        cached = self._resolver.get_cached(dependency_type, is_async=False)
-        if cached is not None:
-            return cached.resolve(self)
-
-        provider = self._get_or_register_provider(dependency_type)
-        compiled = self._resolver.compile(provider, is_async=False)
+        compiled = self._resolver.dispatch.get(dependency_type)
+        if compiled is None:
+            compiled = self._get_compiled(dependency_type, is_async=False)
         return compiled.resolve(self)
 
     @overload
@@ -860,14 +1033,124 @@ class Container:
 
     async def aresolve(self, dependency_type: type[T], /) -> T:
         """Resolve an instance by dependency type asynchronously."""
-        cached = self._resolver.get_cached(dependency_type, is_async=True)
-        if cached is not None:
-            return await cached.resolve(self)
-
-        provider = self._get_or_register_provider(dependency_type)
-        compiled = self._resolver.compile(provider, is_async=True)
+        compiled = self._resolver.async_dispatch.get(dependency_type)
+        if compiled is None:
+            compiled = self._get_compiled(dependency_type, is_async=True)
         return await compiled.resolve(self)
 
+    @overload
+    def resolver_for(self, dependency_type: type[T], /) -> Callable[[], T]: ...
+
+    @overload
+    def resolver_for(self, dependency_type: T, /) -> Callable[[], T]: ...  # type: ignore
+
+    def resolver_for(self, dependency_type: type[T], /) -> Callable[[], T]:
+        """Get a callable bound to the compiled sync resolver of a type.
+
+        The callable rebinds itself when overrides or test mode change.
+        """
+        resolver = self._resolver
+        resolve = self._get_compiled(dependency_type, is_async=False).resolve
+        version = resolver.version
+
+        def resolve_instance() -> T:
+            nonlocal resolve, version
+            if version != resolver.version:
+                version = resolver.version
+                resolve = self._get_compiled(dependency_type, is_async=False).resolve
+            return resolve(self)
+
+        return resolve_instance
+
+    @overload
+    def aresolver_for(
+        self, dependency_type: type[T], /
+    ) -> Callable[[], Awaitable[T]]: ...
+
+    @overload
+    def aresolver_for(self, dependency_type: T, /) -> Callable[[], Awaitable[T]]: ...  # type: ignore
+
+    def aresolver_for(self, dependency_type: type[T], /) -> Callable[[], Awaitable[T]]:
+        """Get a coroutine function bound to the compiled async resolver of a type.
+
+        The coroutine function rebinds itself when overrides or test mode change.
+        """
+        resolver = self._resolver
+        resolve = self._get_compiled(dependency_type, is_async=True).resolve
+        version = resolver.version
+
+        async def resolve_instance() -> T:
+            nonlocal resolve, version
+            if version != resolver.version:
+                version = resolver.version
+                resolve = self._get_compiled(dependency_type, is_async=True).resolve
+            return await resolve(self)
+
+        return resolve_instance
+
+    def resolve_many(self, dependency_types: Iterable[Any], /) -> list[Any]:
+        """Resolve instances for several dependency types at once."""
+        plan = self._get_plan(tuple(dependency_types), is_async=False)
+        return [resolve(self) for resolve in plan.resolvers]
+
+    async def aresolve_many(self, dependency_types: Iterable[Any], /) -> list[Any]:
+        """Resolve instances for several dependency types asynchronously.
+
+        Independent providers with async dependencies are resolved concurrently.
+        """
+        plan = self._get_plan(tuple(dependency_types), is_async=True)
+        if not plan.concurrent:
+            return [await resolve(self) for resolve in plan.resolvers]
+
+        results: list[Any] = [NOT_SET] * len(plan.resolvers)
+        for idx, resolve in enumerate(plan.resolvers):
+            if idx not in plan.concurrent:
+                results[idx] = await resolve(self)
+        instances = await gather(
+            self, [(plan.resolvers[idx], None) for idx in plan.concurrent]
+        )
+        for idx, instance in zip(plan.concurrent, instances, strict=True):
+            results[idx] = instance
+        return results
+
+    def _get_plan(
+        self, dependency_types: tuple[Any, ...], /, *, is_async: bool
+    ) -> ResolvePlan:
+        """Get the cached resolve plan for a tuple of dependency types."""
+        key = (dependency_types, is_async)
+        version = self._resolver.version
+        plan = self._plans.get(key)
+        if plan is not None and plan.version == version:
+            return plan
+
+        resolvers = tuple(
+            self._get_compiled(dependency_type, is_async=is_async).resolve
+            for dependency_type in dependency_types
+        )
+        concurrent: tuple[int, ...] = ()
+        if is_async:
+            providers: list[Provider | None] = [
+                self._get_or_register_provider(dependency_type)
+                for dependency_type in dependency_types
+            ]
+            concurrent = tuple(sorted(self._resolver.get_concurrent_indices(providers)))
+
+        plan = ResolvePlan(version, resolvers, concurrent)
+        self._plans[key] = plan
+        return plan
+
+    def _get_compiled(
+        self, dependency_type: Any, /, *, is_async: bool
+    ) -> CompiledResolver:
+        """Get the compiled resolver for a dependency type, compiling it if needed."""
+        cached = self._resolver.get_cached(dependency_type, is_async=is_async)
+        if cached is not None:
+            return cached
+        # Auto-registration and compilation must not race between threads
+        with self._resolver.lock:
+            provider = self._get_or_register_provider(dependency_type)
+            return self._resolver.compile(provider, is_async=is_async)
+
     def create(self, dependency_type: type[T], /, **defaults: Any) -> T:
         """Create an instance by dependency type."""
         if not defaults:
@@ -890,6 +1173,81 @@ class Container:
         compiled = self._resolver.compile(provider, is_async=True)
         return await compiled.create(self, defaults or None)
 
+    def create_many(
+        self, dependency_type: type[T], defaults: Iterable[dict[str, Any]], /
+    ) -> list[T]:
+        """Create one instance by dependency type per defaults mapping.
+
+        Dependencies with a shared scope are resolved once for the whole batch.
+        """
+        items = list(defaults)
+        if not items:
+            return []
+
+        provider = self._get_or_register_provider(dependency_type, items[0])
+        create = self._resolver.compile(provider, is_async=False).create
+        shared = {
+            name: self.resolve(shared_type)
+            for name, shared_type in self._get_shared_parameters(provider, items[0])
+        }
+        return [create(self, {**shared, **item}) for item in items]
+
+    async def acreate_many(
+        self,
+        dependency_type: type[T],
+        defaults: Iterable[dict[str, Any]],
+        /,
+        *,
+        max_concurrency: int = 10,
+    ) -> list[T]:
+        """Create one instance by dependency type per defaults mapping asynchronously.
+
+        Dependencies with a shared scope are resolved once for the whole batch.
+        Instances with async dependencies are created concurrently, with at most
+        `max_concurrency` of them in flight at a time.
+        """
+        if max_concurrency < 1:
+            raise ValueError("The `max_concurrency` must be greater than 0.")
+
+        items = list(defaults)
+        if not items:
+            return []
+
+        provider = self._get_or_register_provider(dependency_type, items[0])
+        create = self._resolver.compile(provider, is_async=True).create
+        shared = {
+            name: await self.aresolve(shared_type)
+            for name, shared_type in self._get_shared_parameters(provider, items[0])
+        }
+
+        if max_concurrency == 1 or self._resolver.is_sync_subgraph(provider):
+            return [await create(self, {**shared, **item}) for item in items]
+
+        results: list[Any] = [NOT_SET] * len(items)
+        limiter = anyio.CapacityLimiter(max_concurrency)
+
+        async def create_instance(idx: int, item: dict[str, Any]) -> None:
+            async with limiter:
+                results[idx] = await create(self, {**shared, **item})
+
+        async with anyio.create_task_group() as tg:
+            for idx, item in enumerate(items):
+                tg.start_soon(create_instance, idx, item)
+        return results
+
+    def _get_shared_parameters(
+        self, provider: Provider, defaults: dict[str, Any]
+    ) -> list[tuple[str, Any]]:
+        """Get the parameters that resolve to the same instance on every create."""
+        shared: list[tuple[str, Any]] = []
+        for param in provider.parameters:
+            if param.provider is None or param.name in defaults:
+                continue
+            param_provider = self._providers.get(param.dependency_type, param.provider)
+            if param_provider.scope != "transient":
+                shared.append((param.name, param.dependency_type))
+        return shared
+
     def is_resolved(self, dependency_type: Any, /) -> bool:
         """Check if an instance for the dependency type exists."""
         try:
@@ -908,6 +1266,8 @@ class Container:
             return None
         context = self._get_instance_context(provider.scope)
         del context[dependency_type]
+        if provider.scope == "singleton":
+            self._resolver.invalidate_dependents(dependency_type)
 
     def reset(self) -> None:
         """Reset resolved instances."""
@@ -919,6 +1279,8 @@ class Container:
             except LookupError:
                 continue
             del context[dependency_type]
+            if provider.scope == "singleton":
+                self._resolver.invalidate_dependents(dependency_type)
 
     # == Injection Utilities ==
 
@@ -970,7 +1332,7 @@ class Container:
 
     # == Build ==
 
-    def build(self) -> None:
+    def build(self, *, precompile: bool = False, background: bool = False) -> None:
         """Build the container by validating the complete dependency graph."""
         if self.ready:
             raise RuntimeError("Container has already been built")
@@ -980,6 +1342,186 @@ class Container:
         self._validate_scope_compatibility()
 
         self._ready = True
+        self._resolver.load_code_cache()
+
+        # Event resources to start when a context of each scope opens
+        for scope in self._scopes:
+            self._get_scope_events(scope)
+
+        if precompile:
+            self.precompile(background=background)
+
+    def precompile(self, *, background: bool = False) -> None:
+        """Compile resolvers for all registered providers ahead of time.
+
+        Errors are raised in the foreground. With `background`, compilation runs
+        in a daemon thread, errors are logged, and `wait_precompiled()` waits for
+        it to finish.
+        """
+        if not self.ready:
+            raise RuntimeError(
+                "Container must be built before precompiling resolvers. "
+                "Call `build()` first."
+            )
+        self._precompile_duration = None
+        self._precompiled.clear()
+        if not background:
+            self._precompile()
+            return
+
+        threading.Thread(
+            target=self._precompile_in_background,
+            name="anydi-precompile",
+            daemon=True,
+        ).start()
+
+    def wait_precompiled(self, timeout: float | None = None) -> bool:
+        """Block until a precompilation has finished and return if it succeeded."""
+        self._precompiled.wait(timeout)
+        return self._precompiled.is_set() and self._precompile_duration is not None
+
+    @property
+    def precompile_duration(self) -> float | None:
+        """Get the duration of the last precompilation in seconds."""
+        return self._precompile_duration
+
+    def _precompile(self) -> None:
+        """Compile sync and async resolvers for all providers and log the timing."""
+        start = time.perf_counter()
+        try:
+            try:
+                count = self._resolver.precompile()
+            except Exception:
+                self._logger.exception("Failed to precompile resolvers.")
+                raise
+            self._precompile_duration = time.perf_counter() - start
+            self._resolver.save_code_cache()
+        finally:
+            self._precompiled.set()
+        self._logger.info(
+            "Precompiled resolvers for %d providers in %.3f seconds.",
+            count,
+            self._precompile_duration,
+        )
+
+    def _precompile_in_background(self) -> None:
+        with contextlib.suppress(Exception):  # Logged by _precompile()
+            self._precompile()
+
+    def warmup(self, dependency_types: Iterable[Any] | None = None) -> Warmup:
+        """Create singletons in a background thread.
+
+        Without `dependency_types`, all singletons that can be created
+        synchronously are selected. The returned handle reports readiness, so
+        the application can serve liveness checks while singletons are created.
+        """
+        warmup = Warmup(self._get_warmup_types(dependency_types, is_async=False))
+        thread = threading.Thread(
+            target=self._warmup, args=(warmup,), name="anydi-warmup", daemon=True
+        )
+        thread.start()
+        return warmup
+
+    def _warmup(self, warmup: Warmup) -> None:
+        """Create the singletons of a warm-up and report the result."""
+        start = time.perf_counter()
+        try:
+            for dependency_type in warmup.dependency_types:
+                self.resolve(dependency_type)
+        except Exception as exc:
+            self._logger.exception("Failed to warm up singletons.")
+            warmup.complete(time.perf_counter() - start, exc)
+            return
+        self._complete_warmup(warmup, time.perf_counter() - start)
+
+    async def awarmup(
+        self,
+        dependency_types: Iterable[Any] | None = None,
+        *,
+        task_status: TaskStatus[Warmup] = anyio.TASK_STATUS_IGNORED,
+    ) -> Warmup:
+        """Create singletons asynchronously.
+
+        Without `dependency_types`, all singletons are selected and created one
+        after another in the task running the warm-up. Start it with
+        `task_group.start()` to get the handle right away while singletons are
+        created in the background task.
+        """
+        warmup = Warmup(self._get_warmup_types(dependency_types, is_async=True))
+        task_status.started(warmup)
+        start = time.perf_counter()
+        try:
+            for dependency_type in warmup.dependency_types:
+                await self.aresolve(dependency_type)
+        except Exception as exc:
+            self._logger.exception("Failed to warm up singletons.")
+            warmup.complete(time.perf_counter() - start, exc)
+            return warmup
+        self._complete_warmup(warmup, time.perf_counter() - start)
+        return warmup
+
+    def _complete_warmup(self, warmup: Warmup, duration: float) -> None:
+        warmup.complete(duration)
+        self._logger.info(
+            "Warmed up %d singletons in %.3f seconds.",
+            len(warmup.dependency_types),
+            duration,
+        )
+
+    def _get_warmup_types(
+        self, dependency_types: Iterable[Any] | None, *, is_async: bool
+    ) -> list[Any]:
+        """Get the dependency types to create during a warm-up."""
+        if dependency_types is not None:
+            return list(dependency_types)
+
+        async_subgraphs: dict[Any, bool] = {}
+
+        def is_async_subgraph(provider: Provider) -> bool:
+            result = async_subgraphs.get(provider.dependency_type)
+            if result is None:
+                async_subgraphs[provider.dependency_type] = False
+                result = provider.is_async or any(
+                    is_async_subgraph(dependency)
+                    for param in provider.parameters
+                    if (
+                        dependency := self._providers.get(
+                            self._resolve_alias(param.dependency_type)
+                        )
+                    )
+                    is not None
+                )
+                async_subgraphs[provider.dependency_type] = result
+            return result
+
+        return [
+            provider.dependency_type
+            for provider in self._providers.values()
+            if provider.scope == "singleton"
+            and not provider.from_context
+            and (is_async or not is_async_subgraph(provider))
+        ]
+
+    def export_resolvers(self, *, title: str = "container") -> str:
+        """Render a Python module with the resolvers of all providers."""
+        if not self.ready:
+            raise RuntimeError(
+                "Container must be built before exporting resolvers. "
+                "Call `build()` first."
+            )
+        return self._resolver.export_module(title)
+
+    def load_resolvers(self, module: types.ModuleType | str, /) -> None:
+        """Use resolvers from a module generated by `anydi compile`."""
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+        resolvers = getattr(module, "RESOLVERS", None)
+        if not isinstance(resolvers, dict):
+            raise TypeError(
+                f"Module `{module.__name__}` does not define a `RESOLVERS` "
+                "mapping. Generate it with `anydi compile`."
+            )
+        self._resolver.load_static_resolvers(resolvers)  # type: ignore[reportUnknownArgumentType]
 
     def rebuild(self) -> None:
         """Rebuild the container by re-validating the complete dependency graph."""
@@ -1191,11 +1733,11 @@ class Container:
 
     def enable_test_mode(self) -> None:
         """Enable test mode for override support on all resolutions."""
-        self._test_mode = True
+        self._set_test_mode(True)
 
     def disable_test_mode(self) -> None:
         """Disable test mode for override support on all resolutions."""
-        self._test_mode = False
+        self._set_test_mode(False)
 
     @contextlib.contextmanager
     def test_mode(self) -> Iterator[None]:
@@ -1203,11 +1745,16 @@ class Container:
             yield
             return
 
-        self._test_mode = True
+        self._set_test_mode(True)
         try:
             yield
         finally:
-            self._test_mode = False
+            self._set_test_mode(False)
+
+    def _set_test_mode(self, enabled: bool) -> None:
+        """Switch test mode and invalidate bound resolvers."""
+        self._test_mode = enabled
+        self._resolver.notify_mode_changed()
 
     @contextlib.contextmanager
     def override(
@@ -2,59 +2,251 @@ from __future__ import annotations
 
 import contextlib
 import threading
+from collections.abc import Generator, Sequence
+from contextvars import ContextVar, Token
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import anyio.to_thread
 from typing_extensions import Self
 
 from ._async_lock import AsyncRLock
-from ._types import NOT_SET
+from ._backend import run_sync
+from ._types import NOT_SET, intern_key
 
+if TYPE_CHECKING:
+    from ._container import Container
 
-class InstanceContext:
-    """A context to store instances."""
+# Guards the lazy creation of context attributes shared between threads
+_init_lock = threading.Lock()
+
+
+class SlotTable:
+    """Dense slot numbers of the providers cached in the contexts of a scope.
 
-    __slots__ = ("_items", "_stack", "_async_stack", "_lock", "_async_lock")
+    The table is shared by all contexts of a scope, so generated resolvers can
+    index the context storage by a slot number instead of hashing a key.
+    """
+
+    __slots__ = ("_slots", "empty")
 
     def __init__(self) -> None:
-        self._items: dict[Any, Any] = {}
+        self._slots: dict[Any, int] = {}
+        # Initial storage of a new context, one NOT_SET per slot
+        self.empty: tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get(self, key: Any) -> int | None:
+        """Get the slot assigned to an interned key."""
+        return self._slots.get(key)
+
+    def slot_for(self, key: Any) -> int:
+        """Get the slot of an interned key, assigning the next free one."""
+        slot = self._slots.get(key)
+        if slot is None:
+            with _init_lock:
+                slot = self._slots.setdefault(key, len(self._slots))
+                self.empty = (NOT_SET,) * len(self._slots)
+        return slot
+
+
+class InstanceContext:
+    """A context to store instances.
+
+    Instances of keys with a slot in the table of the scope are stored in a list
+    indexed by the slot. Other instances are stored in a dict under interned
+    dependency keys, see `intern_key`.
+    """
+
+    __slots__ = (
+        "_table",
+        "_slots",
+        "_items",
+        "_owner",
+        "_stack",
+        "_async_stack",
+        "_locks",
+        "_async_locks",
+        "_captures",
+        "_resources",
+    )
+
+    def __init__(self, table: SlotTable | None = None) -> None:
+        if table is None:
+            table = SlotTable()
+        self._table = table
+        self._slots: list[Any] = [*table.empty]
+        self._items: dict[Any, Any] | None = None
+        # Thread that opened the context, None once another thread has used it
+        self._owner: int | None = threading.get_ident()
         self._stack: contextlib.ExitStack | None = None
         self._async_stack: contextlib.AsyncExitStack | None = None
-        self._lock: threading.RLock | None = None
-        self._async_lock: AsyncRLock | None = None
+        self._locks: dict[Any, threading.RLock] | None = None
+        self._async_locks: dict[Any, AsyncRLock] | None = None
+        self._captures: dict[int, contextlib.ExitStack] | None = None
+        self._resources: (
+            dict[Any, contextlib.ExitStack | contextlib.AsyncExitStack] | None
+        ) = None
 
     def get(self, key: Any, default: Any = NOT_SET) -> Any:
         """Get an instance from the context."""
-        return self._items.get(key, default)
+        key = intern_key(key)
+        slot = self._table.get(key)
+        if slot is None:
+            if self._items is None:
+                return default
+            return self._items.get(key, default)
+        try:
+            value = self._slots[slot]
+        except IndexError:
+            return default
+        return default if value is NOT_SET else value
 
     def set(self, key: Any, value: Any) -> None:
         """Set an instance in the context."""
+        key = intern_key(key)
+        slot = self._table.get(key)
+        if slot is not None:
+            self.set_slot(slot, value)
+            return
+        if self._items is None:
+            with _init_lock:
+                if self._items is None:
+                    self._items = {}
         self._items[key] = value
 
-    def enter(self, cm: contextlib.AbstractContextManager[Any]) -> Any:
-        """Enter the context."""
+    def set_slot(self, slot: int, value: Any) -> None:
+        """Set an instance by the slot number of its key."""
+        slots = self._slots
+        if slot >= len(slots):
+            with _init_lock:
+                size = max(slot + 1, len(self._table.empty))
+                if size > len(slots):
+                    slots.extend([NOT_SET] * (size - len(slots)))
+        slots[slot] = value
+
+    def clear(self) -> None:
+        """Drop all instances and exit stacks so the context can be reused.
+
+        The context must already be closed. Sync locks are kept, async locks are
+        dropped since they may be bound to an event loop.
+        """
+        self._slots[:] = self._table.empty
+        self._items = None
+        self._stack = None
+        self._async_stack = None
+        self._async_locks = None
+        self._resources = None
+
+    def enter(self, cm: contextlib.AbstractContextManager[Any], key: Any = None) -> Any:
+        """Enter the context.
+
+        With a key, the context manager is entered into its own stack, so the
+        resource can be closed on its own, see `take_resources`.
+        """
+        if key is not None:
+            stack = contextlib.ExitStack()
+            result = stack.enter_context(cm)
+            self._add_resource(key, stack)
+            self._enter(stack)
+            return result
+        return self._enter(cm)
+
+    def _enter(self, cm: contextlib.AbstractContextManager[Any]) -> Any:
+        captures = self._captures
+        if captures is not None:
+            stack = captures.get(threading.get_ident())
+            if stack is not None:
+                return stack.enter_context(cm)
         if self._stack is None:
-            self._stack = contextlib.ExitStack()
+            with _init_lock:
+                if self._stack is None:
+                    self._stack = contextlib.ExitStack()
         return self._stack.enter_context(cm)
 
-    async def aenter(self, cm: contextlib.AbstractAsyncContextManager[Any]) -> Any:
-        """Enter the context asynchronously."""
+    def _add_resource(
+        self, key: Any, stack: contextlib.ExitStack | contextlib.AsyncExitStack
+    ) -> None:
+        if self._resources is None:
+            with _init_lock:
+                if self._resources is None:
+                    self._resources = {}
+        self._resources[key] = stack
+
+    def take_resources(
+        self,
+    ) -> dict[Any, contextlib.ExitStack | contextlib.AsyncExitStack]:
+        """Take the stacks of the resources entered with a key.
+
+        Closing a taken stack closes its resource, the stack is still exited by
+        the context afterwards, which is then a no-op.
+        """
+        with _init_lock:
+            resources, self._resources = self._resources, None
+        return resources or {}
+
+    @contextlib.contextmanager
+    def capture(self) -> Generator[contextlib.ExitStack]:
+        """Enter context managers of the current thread into a separate stack.
+
+        The caller decides when the captured stack is added to the context, which
+        keeps the exit order deterministic when several threads enter at once.
+        """
+        if self._captures is None:
+            with _init_lock:
+                if self._captures is None:
+                    self._captures = {}
+        ident = threading.get_ident()
+        stack = contextlib.ExitStack()
+        self._captures[ident] = stack
+        try:
+            yield stack
+        finally:
+            del self._captures[ident]
+
+    async def aenter(
+        self, cm: contextlib.AbstractAsyncContextManager[Any], key: Any = None
+    ) -> Any:
+        """Enter the context asynchronously.
+
+        With a key, the context manager is entered into its own stack, see `enter`.
+        """
+        if key is not None:
+            stack = contextlib.AsyncExitStack()
+            result = await stack.enter_async_context(cm)
+            self._add_resource(key, stack)
+            await self._aenter(stack)
+            return result
+        return await self._aenter(cm)
+
+    async def _aenter(self, cm: contextlib.AbstractAsyncContextManager[Any]) -> Any:
         if self._async_stack is None:
-            self._async_stack = contextlib.AsyncExitStack()
+            with _init_lock:
+                if self._async_stack is None:
+                    self._async_stack = contextlib.AsyncExitStack()
         return await self._async_stack.enter_async_context(cm)
 
     def __setitem__(self, key: Any, value: Any) -> None:
-        self._items[key] = value
+        self.set(key, value)
 
     def __getitem__(self, key: Any) -> Any:
-        return self._items[key]
+        value = self.get(key)
+        if value is NOT_SET:
+            raise KeyError(key)
+        return value
 
     def __contains__(self, key: Any) -> bool:
-        return key in self._items
+        return self.get(key) is not NOT_SET
 
     def __delitem__(self, key: Any) -> None:
-        self._items.pop(key, None)
+        key = intern_key(key)
+        slot = self._table.get(key)
+        if slot is None:
+            if self._items is not None:
+                self._items.pop(key, None)
+        elif slot < len(self._slots):
+            self._slots[slot] = NOT_SET
 
     def __enter__(self) -> Self:
         """Enter the context."""
@@ -69,12 +261,24 @@ class InstanceContext:
         """Exit the context."""
         if self._stack is None:
             return False
-        return self._stack.__exit__(exc_type, exc_val, exc_tb)
+        try:
+            return self._stack.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._drop_resources(contextlib.ExitStack)
 
     def close(self) -> None:
         """Close the scoped context."""
-        if self._stack is not None:
-            self._stack.__exit__(None, None, None)
+        self.__exit__(None, None, None)
+
+    def _drop_resources(self, stack_type: type[Any]) -> None:
+        """Forget the resource stacks of a type once they have been exited."""
+        with _init_lock:
+            if self._resources is not None:
+                self._resources = {
+                    key: stack
+                    for key, stack in self._resources.items()
+                    if not isinstance(stack, stack_type)
+                } or None
 
     async def __aenter__(self) -> Self:
         """Enter the context asynchronously."""
@@ -90,25 +294,246 @@ class InstanceContext:
         sync_exit = False
         async_exit = False
         if self._stack is not None:
-            sync_exit = await anyio.to_thread.run_sync(
-                self.__exit__, exc_type, exc_val, exc_tb
-            )
+            sync_exit = await run_sync(self.__exit__, exc_type, exc_val, exc_tb)
         if self._async_stack is not None:
-            async_exit = await self._async_stack.__aexit__(exc_type, exc_val, exc_tb)
+            try:
+                async_exit = await self._async_stack.__aexit__(
+                    exc_type, exc_val, exc_tb
+                )
+            finally:
+                self._drop_resources(contextlib.AsyncExitStack)
         return bool(sync_exit) or bool(async_exit)
 
     async def aclose(self) -> None:
         """Close the scoped context asynchronously."""
         await self.__aexit__(None, None, None)
 
-    def lock(self) -> threading.RLock:
-        """Acquire the context lock."""
-        if self._lock is None:
-            self._lock = threading.RLock()
-        return self._lock
-
-    def alock(self) -> AsyncRLock:
-        """Acquire the context lock asynchronously."""
-        if self._async_lock is None:
-            self._async_lock = AsyncRLock()
-        return self._async_lock
+    def lock_for(self, key: Any) -> threading.RLock:
+        """Get the lock guarding the creation of the instance for a key.
+
+        Instances are created under their own lock, so a slow factory does not
+        block unrelated ones. Dependencies resolved through parameters take the
+        locks along the acyclic dependency graph, in a consistent order. This
+        does not hold for factories that call `container.resolve` themselves,
+        which can deadlock if two of them wait for each other's instances.
+
+        The context is marked as shared, so request and custom scope resolvers
+        lock from then on, also in the thread that opened the context.
+        """
+        self._owner = None
+        locks = self._locks
+        if locks is None:
+            with _init_lock:
+                if self._locks is None:
+                    self._locks = {}
+                locks = self._locks
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks.setdefault(key, threading.RLock())
+        return lock
+
+    def alock_for(self, key: Any) -> AsyncRLock:
+        """Get the async lock guarding the creation of the instance for a key.
+
+        Concurrent tasks resolving the same key wait for a single creation,
+        while different keys are created in parallel.
+        """
+        locks = self._async_locks
+        if locks is None:
+            with _init_lock:
+                if self._async_locks is None:
+                    self._async_locks = {}
+                locks = self._async_locks
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks.setdefault(key, AsyncRLock())
+        return lock
+
+
+class ContextPool:
+    """Pool of closed contexts of a scope that are cleared and reused.
+
+    Up to `size` contexts are kept. A context taken from the pool is empty, so
+    instances never leak between the blocks that use it.
+    """
+
+    __slots__ = ("_table", "_size", "_free")
+
+    def __init__(self, table: SlotTable, size: int) -> None:
+        self._table = table
+        self._size = size
+        self._free: list[InstanceContext] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> InstanceContext:
+        """Get a context from the pool or create a new one."""
+        try:
+            context = self._free.pop()
+        except IndexError:
+            return InstanceContext(self._table)
+        context._owner = threading.get_ident()  # type: ignore[reportPrivateUsage]
+        return context
+
+    def release(self, context: InstanceContext) -> None:
+        """Clear a closed context and return it to the pool if there is room."""
+        context.clear()
+        if len(self._free) < self._size:
+            self._free.append(context)
+
+
+class ScopedContext(contextlib.ContextDecorator):
+    """Context manager that opens an instance context of a scope.
+
+    If a context of the scope is already active, it is reused and left open on
+    exit. Otherwise a new context is created or taken from the pool, the event
+    resources of the scope are started, and the context is closed on exit.
+
+    It can also be used as a decorator, each call then opens its own context.
+    """
+
+    __slots__ = (
+        "_container",
+        "_context_var",
+        "_table",
+        "_pool",
+        "_events",
+        "_context",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        container: Container,
+        context_var: ContextVar[InstanceContext],
+        table: SlotTable,
+        pool: ContextPool | None,
+        events: Sequence[Any],
+    ) -> None:
+        self._container = container
+        self._context_var = context_var
+        self._table = table
+        self._pool = pool
+        self._events = events
+        self._context: InstanceContext | None = None
+        self._token: Token[InstanceContext] | None = None
+
+    def _recreate_cm(self) -> Self:
+        # Each decorated call gets a fresh manager, the state is per entry
+        return type(self)(
+            self._container, self._context_var, self._table, self._pool, self._events
+        )
+
+    def __enter__(self) -> InstanceContext:
+        context = self._context_var.get(None)
+        if context is not None:
+            return context
+
+        pool = self._pool
+        context = InstanceContext(self._table) if pool is None else pool.acquire()
+        self._context = context
+        self._token = self._context_var.set(context)
+        if self._events:
+            try:
+                for dependency_type in self._events:
+                    self._container.resolve(dependency_type)
+            except BaseException as exc:
+                self.__exit__(type(exc), exc, exc.__traceback__)
+                raise
+        return context
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        context = self._context
+        token = self._token
+        if context is None or token is None:
+            return False
+        self._context = None
+        self._token = None
+        try:
+            return context.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._context_var.reset(token)
+            if self._pool is not None:
+                self._pool.release(context)
+
+
+class AsyncScopedContext(contextlib.AsyncContextDecorator):
+    """Async context manager that opens an instance context of a scope.
+
+    See `ScopedContext`, event resources are started asynchronously.
+    """
+
+    __slots__ = (
+        "_container",
+        "_context_var",
+        "_table",
+        "_pool",
+        "_events",
+        "_context",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        container: Container,
+        context_var: ContextVar[InstanceContext],
+        table: SlotTable,
+        pool: ContextPool | None,
+        events: Sequence[Any],
+    ) -> None:
+        self._container = container
+        self._context_var = context_var
+        self._table = table
+        self._pool = pool
+        self._events = events
+        self._context: InstanceContext | None = None
+        self._token: Token[InstanceContext] | None = None
+
+    def _recreate_cm(self) -> Self:
+        # Each decorated call gets a fresh manager, the state is per entry
+        return type(self)(
+            self._container, self._context_var, self._table, self._pool, self._events
+        )
+
+    async def __aenter__(self) -> InstanceContext:
+        context = self._context_var.get(None)
+        if context is not None:
+            return context
+
+        pool = self._pool
+        context = InstanceContext(self._table) if pool is None else pool.acquire()
+        self._context = context
+        self._token = self._context_var.set(context)
+        if self._events:
+            try:
+                for dependency_type in self._events:
+                    await self._container.aresolve(dependency_type)
+            except BaseException as exc:
+                await self.__aexit__(type(exc), exc, exc.__traceback__)
+                raise
+        return context
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        context = self._context
+        token = self._token
+        if context is None or token is None:
+            return False
+        self._context = None
+        self._token = None
+        try:
+            return await context.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._context_var.reset(token)
+            if self._pool is not None:
+                self._pool.release(context)
@@ -35,35 +35,126 @@ class Injector:
 
     def inject(self, call: Callable[P, T]) -> Callable[P, T]:
         """Inject dependencies into a callable."""
-        if call in self._cache:
-            return cast(Callable[P, T], self._cache[call])
+        cached = self._cache.get(call)
+        if cached is not None:
+            return cast(Callable[P, T], cached)
 
         injected_params = self._get_injected_params(call)
         if not injected_params:
-            self._cache[call] = call
+            self._cache.setdefault(call, call)
             return call
 
-        if inspect.iscoroutinefunction(call):
+        is_async = inspect.iscoroutinefunction(call)
+        if self.container._resolver.static:  # type: ignore[reportPrivateUsage]
+            wrapper = self._build_wrapper(call, injected_params, is_async=is_async)
+        else:
+            wrapper = self._compile_wrapper(call, injected_params, is_async=is_async)
+        # Threads racing on the first call all get the first published wrapper
+        wrapper = self._cache.setdefault(call, wrapper)
+
+        return cast(Callable[P, T], wrapper)
+
+    def _compile_wrapper(
+        self,
+        call: Callable[..., Any],
+        injected_params: dict[str, Any],
+        *,
+        is_async: bool,
+    ) -> Callable[..., Any]:
+        """Compile a wrapper that passes resolved dependencies as keyword arguments.
+
+        The compiled resolvers of the injected parameters are bound into the
+        wrapper namespace and rebound whenever the resolver version changes.
+        """
+        container = self.container
+        resolver = container._resolver  # type: ignore[reportPrivateUsage]
+        dependency_types = list(injected_params.values())
+
+        lines: list[str] = []
+        if is_async:
+            lines.append("async def _wrapper(*args, **kwargs):")
+        else:
+            lines.append("def _wrapper(*args, **kwargs):")
+        lines.append("    if _version != resolver._version:")
+        lines.append("        _bind()")
+        for idx, name in enumerate(injected_params):
+            if is_async:
+                lines.append(f"    kwargs['{name}'] = await _resolver_{idx}(container)")
+            else:
+                lines.append(f"    kwargs['{name}'] = _resolver_{idx}(container)")
+        if is_async:
+            lines.append("    return await _call(*args, **kwargs)")
+        else:
+            lines.append("    return _call(*args, **kwargs)")
+
+        ns: dict[str, Any] = {
+            "_call": call,
+            "_version": -1,
+            "container": container,
+            "resolver": resolver,
+        }
+
+        def bind() -> None:
+            version = resolver.version
+            for idx, dependency_type in enumerate(dependency_types):
+                compiled = container._get_compiled(  # type: ignore[reportPrivateUsage]
+                    dependency_type, is_async=is_async
+                )
+                ns[f"_resolver_{idx}"] = compiled.resolve
+            ns["_version"] = version
+
+        ns["_bind"] = bind
+
+        exec("\n".join(lines), ns)
+        return functools.update_wrapper(ns["_wrapper"], call)
+
+    def _build_wrapper(
+        self,
+        call: Callable[..., Any],
+        injected_params: dict[str, Any],
+        *,
+        is_async: bool,
+    ) -> Callable[..., Any]:
+        """Build a wrapper like `_compile_wrapper` without generating code.
+
+        Used when resolvers are loaded from a module generated by
+        `anydi compile`, so injection does not call `exec` either.
+        """
+        container = self.container
+        resolver = container._resolver  # type: ignore[reportPrivateUsage]
+        names = tuple(injected_params)
+        dependency_types = tuple(injected_params.values())
+        # Bound resolvers and the resolver version they were compiled for
+        state: list[Any] = [-1, ()]
+
+        def bind() -> tuple[Any, ...]:
+            version = resolver.version
+            resolvers = tuple(
+                container._get_compiled(  # type: ignore[reportPrivateUsage]
+                    dependency_type, is_async=is_async
+                ).resolve
+                for dependency_type in dependency_types
+            )
+            state[:] = [version, resolvers]
+            return resolvers
 
-            @functools.wraps(call)
-            async def awrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                for name, annotation in injected_params.items():
-                    kwargs[name] = await self.container.aresolve(annotation)
-                return cast(T, await call(*args, **kwargs))
+        if is_async:
 
-            self._cache[call] = awrapper
+            async def awrapper(*args: Any, **kwargs: Any) -> Any:
+                resolvers = state[1] if state[0] == resolver.version else bind()
+                for name, resolve in zip(names, resolvers, strict=True):
+                    kwargs[name] = await resolve(container)
+                return await call(*args, **kwargs)
 
-            return awrapper  # type: ignore
+            return functools.update_wrapper(awrapper, call)
 
-        @functools.wraps(call)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            for name, annotation in injected_params.items():
-                kwargs[name] = self.container.resolve(annotation)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            resolvers = state[1] if state[0] == resolver.version else bind()
+            for name, resolve in zip(names, resolvers, strict=True):
+                kwargs[name] = resolve(container)
             return call(*args, **kwargs)
 
-        self._cache[call] = wrapper
-
-        return wrapper
+        return functools.update_wrapper(wrapper, call)
 
     def _get_injected_params(self, call: Callable[..., Any]) -> dict[str, Any]:
         """Get the injected parameters of a callable object."""
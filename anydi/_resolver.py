@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 import contextlib
+import linecache
+import re
+import sys
+import threading
+import types
 from typing import TYPE_CHECKING, Any, NamedTuple
 
-import anyio.to_thread
+import anyio
 import wrapt  # type: ignore
 from typing_extensions import type_repr
 
+from ._backend import run_sync
+from ._code_cache import CodeCache, source_digest
 from ._provider import Provider
-from ._types import NOT_SET, is_async_context_manager, is_context_manager
+from ._types import (
+    NOT_SET,
+    Scope,
+    intern_key,
+    is_async_context_manager,
+    is_context_manager,
+)
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import BaseExceptionGroup
 
 if TYPE_CHECKING:
     from ._container import Container
 
+# Guards patching of instance classes for override support
+_patch_lock = threading.Lock()
+
 
 class InstanceProxy(wrapt.ObjectProxy):  # type: ignore
     """Proxy for dependency instances to enable override support."""
@@ -28,14 +47,80 @@ class InstanceProxy(wrapt.ObjectProxy):  # type: ignore
         return self._self_dependency_type
 
 
+def qualify_code(code: types.CodeType, prefix: str) -> types.CodeType:
+    """Prefix the qualified names of the functions defined by generated code."""
+    if sys.version_info < (3, 11):  # pragma: no cover
+        return code
+    consts = tuple(
+        const.replace(co_qualname=f"{prefix}.{const.co_qualname}")
+        if isinstance(const, types.CodeType)
+        else const
+        for const in code.co_consts
+    )
+    return code.replace(co_consts=consts)
+
+
 class CompiledResolver(NamedTuple):
     resolve: Any
     create: Any
 
 
+class ResolvePlan(NamedTuple):
+    version: int
+    resolvers: tuple[Any, ...]
+    concurrent: tuple[int, ...]
+
+
+async def gather(container: Container, calls: list[tuple[Any, Any]]) -> list[Any]:
+    """Await dependency resolvers concurrently and return results in order."""
+    if len(calls) == 1:
+        resolve, context = calls[0]
+        return [await resolve(container, context)]
+
+    results: list[Any] = [NOT_SET] * len(calls)
+
+    async def run(idx: int, resolve: Any, context: Any) -> None:
+        results[idx] = await resolve(container, context)
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for idx, (resolve, context) in enumerate(calls):
+                tg.start_soon(run, idx, resolve, context)
+    except BaseExceptionGroup as exc_group:
+        # Surface a single failure as is, like sequential resolution does
+        if len(exc_group.exceptions) == 1:
+            raise exc_group.exceptions[0] from None
+        raise
+    return results
+
+
 class Resolver:
-    def __init__(self, container: Container) -> None:
+    def __init__(
+        self,
+        container: Container,
+        *,
+        flatten: bool = False,
+        fold_singletons: bool = False,
+        concurrent: bool = False,
+        code_cache: CodeCache | None = None,
+    ) -> None:
         self._container = container
+        # Inline transient dependency subtrees into a single generated function
+        self._flatten = flatten
+        # Bind already created singletons as constants into dependent resolvers
+        self._fold_singletons = fold_singletons
+        # Dependent types of each dependency type, used to drop stale resolvers
+        self._dependents: dict[Any, set[Any]] = {}
+        # Whether the whole subgraph of a provider can be resolved synchronously
+        self._sync_subgraphs: dict[Any, bool] = {}
+        # Resolve independent async dependencies concurrently
+        self._concurrent = concurrent
+        # Persistent cache of compiled code objects (opt-in)
+        self._code_cache = code_cache
+        # Resolver functions loaded from a module generated by `anydi compile`
+        self._static_resolvers: dict[str, type] | None = None
+        # Generated sources recorded for `anydi compile`
+        self._sources: dict[str, tuple[str, str]] | None = None
         # Normal caches (fast path, no override checks)
         self._cache: dict[Any, CompiledResolver] = {}
         self._async_cache: dict[Any, CompiledResolver] = {}
@@ -44,85 +129,388 @@ class Resolver:
         self._async_override_cache: dict[Any, CompiledResolver] = {}
         # Override instances storage
         self._overrides: dict[Any, Any] = {}
+        # Override mode and the active caches, swapped when the mode changes
+        self.override_mode = False
+        self.dispatch = self._cache
+        self.async_dispatch = self._async_cache
+        # Bumped whenever previously bound resolvers may become stale
+        self._version = 0
+        # Guards compilation and cache invalidation, lookups never take it
+        self.lock = threading.RLock()
 
     @property
-    def override_mode(self) -> bool:
-        """Check if override mode is enabled."""
-        return bool(self._overrides) or getattr(self._container, "_test_mode", False)
+    def version(self) -> int:
+        """Get the version of the compiled resolvers."""
+        return self._version
+
+    @property
+    def static(self) -> bool:
+        """Check if resolvers are loaded from a module generated by `anydi compile`."""
+        return self._static_resolvers is not None
+
+    def notify_mode_changed(self) -> None:
+        """Swap the active caches and invalidate bound resolvers."""
+        with self.lock:
+            override_mode = bool(self._overrides) or getattr(
+                self._container, "_test_mode", False
+            )
+            if override_mode:
+                self.dispatch = self._override_cache
+                self.async_dispatch = self._async_override_cache
+            else:
+                self.dispatch = self._cache
+                self.async_dispatch = self._async_cache
+            self.override_mode = override_mode
+            self._version += 1
 
     def add_override(self, dependency_type: Any, instance: Any) -> None:
         """Add an override for a type, its canonical type, and all aliases."""
-        self._overrides[dependency_type] = instance
-        canonical = self._container.aliases.get(dependency_type)
-        if canonical is not None:
-            self._overrides[canonical] = instance
-        for alias, canon in self._container.aliases.items():
-            if canon == dependency_type:
-                self._overrides[alias] = instance
+        with self.lock:
+            self._overrides[dependency_type] = instance
+            canonical = self._container.aliases.get(dependency_type)
+            if canonical is not None:
+                self._overrides[canonical] = instance
+            for alias, canon in self._container.aliases.items():
+                if canon == dependency_type:
+                    self._overrides[alias] = instance
+            self.notify_mode_changed()
 
     def remove_override(self, dependency_type: Any) -> None:
         """Remove an override for a type, its canonical type, and all aliases."""
-        self._overrides.pop(dependency_type, None)
-        canonical = self._container.aliases.get(dependency_type)
-        if canonical is not None:
-            self._overrides.pop(canonical, None)
-        for alias, canon in self._container.aliases.items():
-            if canon == dependency_type:
-                self._overrides.pop(alias, None)
+        with self.lock:
+            self._overrides.pop(dependency_type, None)
+            canonical = self._container.aliases.get(dependency_type)
+            if canonical is not None:
+                self._overrides.pop(canonical, None)
+            for alias, canon in self._container.aliases.items():
+                if canon == dependency_type:
+                    self._overrides.pop(alias, None)
+            self.notify_mode_changed()
 
     def clear_caches(self) -> None:
         """Clear all cached resolvers."""
-        self._cache.clear()
-        self._async_cache.clear()
-        self._override_cache.clear()
-        self._async_override_cache.clear()
+        with self.lock:
+            self._cache.clear()
+            self._async_cache.clear()
+            self._override_cache.clear()
+            self._async_override_cache.clear()
+            self._dependents.clear()
+            self._sync_subgraphs.clear()
+            self.notify_mode_changed()
+
+    def invalidate_dependents(self, dependency_type: Any) -> None:
+        """Drop resolvers that depend on the given type, directly or not.
+
+        Used when singleton folding is enabled, so dependents are recompiled
+        with the singleton bound as a constant once it has been created, and
+        without the stale constant once it has been released.
+        """
+        with self.lock:
+            dependents = self._dependents.pop(dependency_type, None)
+            if not dependents:
+                return
+
+            stale: set[Any] = set()
+            pending = list(dependents)
+            while pending:
+                dependent = pending.pop()
+                if dependent in stale:
+                    continue
+                stale.add(dependent)
+                pending.extend(self._dependents.pop(dependent, ()))
+
+            for alias, canonical in self._container.aliases.items():
+                if canonical in stale:
+                    stale.add(alias)
+            for dependent in stale:
+                self._cache.pop(dependent, None)
+                self._async_cache.pop(dependent, None)
+            self._version += 1
+
+    def _add_dependent(self, dependency_type: Any, dependent: Any) -> None:
+        self._dependents.setdefault(dependency_type, set()).add(dependent)
+
+    def _get_folded_instance(self, provider: Provider) -> Any:
+        """Get the created instance of a singleton provider, if any."""
+        if provider.scope != "singleton" or provider.from_context:
+            return NOT_SET
+        return self._container._singleton_context.get(provider.dependency_type)  # type: ignore[reportPrivateUsage]
 
     def get_cached(
         self, dependency_type: Any, *, is_async: bool
     ) -> CompiledResolver | None:
         """Get cached resolver if it exists."""
-        if self.override_mode:
-            cache = self._async_override_cache if is_async else self._override_cache
-        else:
-            cache = self._async_cache if is_async else self._cache
+        cache = self.async_dispatch if is_async else self.dispatch
         return cache.get(dependency_type)
 
     def compile(self, provider: Provider, *, is_async: bool) -> CompiledResolver:
         """Compile an optimized resolver function for the given provider."""
-        # Select the appropriate cache based on sync/async mode and override mode
-        if self.override_mode:
-            cache = self._async_override_cache if is_async else self._override_cache
-        else:
-            cache = self._async_cache if is_async else self._cache
+        # Select the active cache for the sync/async mode
+        cache = self.async_dispatch if is_async else self.dispatch
+
+        # Check if already compiled in cache (lock-free read path)
+        compiled = cache.get(provider.dependency_type)
+        if compiled is not None:
+            return compiled
+
+        with self.lock:
+            # Another thread may have compiled it, or the mode may have changed
+            cache = self.async_dispatch if is_async else self.dispatch
+            if provider.dependency_type in cache:
+                return cache[provider.dependency_type]
+
+            if is_async and self.is_sync_subgraph(provider):
+                # Call the sync resolver from a single coroutine instead of
+                # awaiting one coroutine per dependency level
+                compiled = self._compile_async_shim(
+                    self.compile(provider, is_async=False)
+                )
+            else:
+                # Recursively compile dependencies first
+                for param in provider.parameters:
+                    if param.provider is not None:
+                        # Look up the current provider to handle overrides
+                        current_provider = self._container.providers.get(
+                            param.dependency_type
+                        )
+                        if current_provider is not None:
+                            self.compile(current_provider, is_async=is_async)
+                        else:
+                            self.compile(param.provider, is_async=is_async)
+
+                # Compile the resolver and creator functions
+                compiled = self._compile_resolver(
+                    provider, is_async=is_async, with_override=self.override_mode
+                )
 
-        # Check if already compiled in cache
-        if provider.dependency_type in cache:
-            return cache[provider.dependency_type]
+            # Publish the compiled functions, readers never take the lock
+            cache[provider.dependency_type] = compiled
 
-        # Recursively compile dependencies first
-        for param in provider.parameters:
-            if param.provider is not None:
-                # Look up the current provider to handle overrides
-                current_provider = self._container.providers.get(param.dependency_type)
-                if current_provider is not None:
-                    self.compile(current_provider, is_async=is_async)
-                else:
-                    self.compile(param.provider, is_async=is_async)
+            # Also store under all aliases that point to this type
+            for alias, canonical in self._container.aliases.items():
+                if canonical == provider.dependency_type:
+                    cache[alias] = compiled
+
+            return compiled
 
-        # Compile the resolver and creator functions
-        compiled = self._compile_resolver(
-            provider, is_async=is_async, with_override=self.override_mode
+    def is_sync_subgraph(self, provider: Provider) -> bool:
+        """Check if a provider and all its dependencies are synchronous.
+
+        Sync generators and context manager classes are excluded as well, since
+        the async resolvers enter them in a worker thread.
+        """
+        is_sync = self._sync_subgraphs.get(provider.dependency_type)
+        if is_sync is not None:
+            return is_sync
+
+        is_sync = not (
+            provider.is_async
+            or provider.is_generator
+            or (
+                provider.is_class
+                and (
+                    is_context_manager(provider.factory)
+                    or is_async_context_manager(provider.factory)
+                )
+            )
+        )
+        if is_sync:
+            for param in provider.parameters:
+                if param.provider is None:
+                    continue
+                current_provider = (
+                    self._container.providers.get(param.dependency_type)
+                    or param.provider
+                )
+                if not self.is_sync_subgraph(current_provider):
+                    is_sync = False
+                    break
+
+        self._sync_subgraphs[provider.dependency_type] = is_sync
+        return is_sync
+
+    def get_concurrent_indices(self, providers: list[Provider | None]) -> set[int]:
+        """Get the positions of providers that can be resolved concurrently.
+
+        Only providers with an async subgraph are worth running concurrently.
+        Shared instances are created once, since async creation is guarded by a
+        per-provider lock in every cached scope.
+        """
+        candidates = {
+            idx
+            for idx, provider in enumerate(providers)
+            if provider is not None and not self.is_sync_subgraph(provider)
+        }
+        return candidates if len(candidates) > 1 else set()
+
+    @staticmethod
+    def _compile_async_shim(compiled: CompiledResolver) -> CompiledResolver:
+        """Wrap sync resolver functions into coroutine functions."""
+        sync_resolve = compiled.resolve
+        sync_create = compiled.create
+
+        async def _resolver(container: Container, context: Any = None) -> Any:
+            return sync_resolve(container, context)
+
+        async def _resolver_create(container: Container, defaults: Any = None) -> Any:
+            return sync_create(container, defaults)
+
+        return CompiledResolver(_resolver, _resolver_create)
+
+    def precompile(self) -> int:
+        """Compile sync and async resolvers for all registered providers."""
+        providers = list(self._container.providers.values())
+        for provider in providers:
+            self.compile(provider, is_async=False)
+            self.compile(provider, is_async=True)
+        return len(providers)
+
+    def fingerprint(self) -> str:
+        """Get a fingerprint of the provider graph."""
+        lines: list[str] = []
+        for provider in self._container.providers.values():
+            params = ",".join(
+                f"{param.name}:{type_repr(param.dependency_type)}:"
+                f"{param.has_default}:{param.shared_scope}:"
+                f"{param.provider.scope if param.provider else None}"
+                for param in provider.parameters
+            )
+            lines.append(
+                f"{provider!r}|{provider.scope}|{provider.from_context}|"
+                f"{provider.is_class}|{provider.is_coroutine}|{provider.is_generator}|"
+                f"{provider.is_async_generator}|{params}"
+            )
+        lines.sort()
+        return "\n".join(lines)
+
+    def load_code_cache(self) -> None:
+        """Load compiled code objects matching the current provider graph."""
+        if self._code_cache is not None:
+            self._code_cache.load(self.fingerprint())
+
+    def save_code_cache(self) -> None:
+        """Persist newly compiled code objects."""
+        if self._code_cache is None:
+            return
+        try:
+            self._code_cache.save()
+        except OSError as exc:
+            self._container.logger.warning(
+                "Failed to save resolver code cache: %s", exc
+            )
+
+    def load_static_resolvers(self, resolvers: dict[str, type]) -> None:
+        """Use resolver functions from a module generated by `anydi compile`.
+
+        Singleton folding is turned off, folded resolvers bind created instances
+        and cannot be generated ahead of time.
+        """
+        self._static_resolvers = resolvers
+        self._fold_singletons = False
+        self.clear_caches()
+
+    def export_module(self, title: str) -> str:
+        """Render a module with the resolver functions of all providers.
+
+        The sources are recorded with the options that shape the generated code,
+        as used by a container that loads the module, see `load_static_resolvers`.
+        """
+        recorder = Resolver(
+            self._container,
+            flatten=self._flatten,
+            fold_singletons=False,
+            concurrent=self._concurrent,
         )
+        recorder._sources = {}
+        recorder.precompile()
+
+        lines: list[str] = [
+            f'"""Resolvers generated by `anydi compile` for `{title}`.',
+            "",
+            "Do not edit this module, regenerate it whenever providers change.",
+            '"""',
+            "",
+            "# ruff: noqa",
+            "# fmt: off",
+            "",
+        ]
+        class_names: dict[str, str] = {}
+        for digest, (src, label) in recorder._sources.items():
+            base_name = re.sub(r"\W", "_", label)
+            name = base_name
+            counter = 1
+            while name in class_names.values():
+                counter += 1
+                name = f"{base_name}_{counter}"
+            class_names[digest] = name
+
+            lines.append("")
+            lines.append(f"class {name}:")
+            lines.extend(f"    {line}" if line else "" for line in src.splitlines())
+            lines.append("")
+
+        lines.append("")
+        lines.append("RESOLVERS = {")
+        for digest, name in class_names.items():
+            lines.append(f'    "{digest}": {name},')
+        lines.append("}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _exec(self, src: str, ns: dict[str, Any]) -> None:
+        """Execute generated source, reusing compiled code when available.
+
+        The code is compiled under a filename unique to the provider, for example
+        ``<anydi:myapp.Service:sync:1a2b3c4d>``, and the source is registered in
+        `linecache`, so tracebacks and profilers show which provider a frame
+        belongs to.
+        """
+        digest = source_digest(src, "<string>")
+        mode = "async" if src.startswith("async ") else "sync"
+        label = type_repr(ns["_dependency_type"])
+
+        if self._sources is not None:
+            self._sources[digest] = (src, f"{label}__{mode}")
+
+        if self._static_resolvers is not None:
+            static = self._static_resolvers.get(digest)
+            if static is not None:
+                for name, value in vars(static).items():
+                    if isinstance(value, types.FunctionType):
+                        ns[name] = types.FunctionType(
+                            value.__code__, ns, name, value.__defaults__
+                        )
+                return
+
+        filename = f"<anydi:{label}:{mode}:{digest[:8]}>"
+        if self._code_cache is None:
+            code = compile(src, filename, "exec")
+        else:
+            code = self._code_cache.compile(src, filename, digest)
 
-        # Store the compiled functions in the cache
-        cache[provider.dependency_type] = compiled
+        linecache.cache[filename] = (len(src), None, src.splitlines(True), filename)
+        exec(qualify_code(code, label), ns)
 
-        # Also store under all aliases that point to this type
-        for alias, canonical in self._container.aliases.items():
-            if canonical == provider.dependency_type:
-                cache[alias] = compiled
+    def _get_slot(self, provider: Provider, scope: Scope) -> int | None:
+        """Get the context slot of a provider cached in the given scope."""
+        if provider.scope != scope or scope == "transient":
+            return None
+        table = self._container._slot_tables[scope]  # type: ignore[reportPrivateUsage]
+        return table.slot_for(intern_key(provider.dependency_type))
 
-        return compiled
+    def _add_slot_read(
+        self,
+        lines: list[str],
+        *,
+        target: str = "inst",
+        slot: str = "_slot",
+        indent: str,
+    ) -> None:
+        """Add reading an instance from the context storage by its slot."""
+        lines.append(f"{indent}try:")
+        lines.append(f"{indent}    {target} = context._slots[{slot}]")
+        lines.append(f"{indent}except IndexError:")
+        lines.append(f"{indent}    {target} = NOT_SET_")
 
     def _add_override_check(
         self, lines: list[str], *, include_not_set: bool = False
@@ -173,13 +561,20 @@ class Resolver:
                 provider, is_async=is_async, with_override=with_override
             )
 
+        flatten = self._flatten and not with_override
+        fold = self._fold_singletons and not with_override
+        inline_ns: dict[str, Any] = {}
+
         num_params = len(provider.parameters)
         param_resolvers: list[Any] = [None] * num_params
+        param_providers: list[Provider | None] = [None] * num_params
+        param_inlines: list[str | None] = [None] * num_params
         param_types: list[Any] = [None] * num_params
         param_defaults: list[Any] = [None] * num_params
         param_has_default: list[bool] = [False] * num_params
         param_names: list[str] = [""] * num_params
         param_shared_scopes: list[bool] = [False] * num_params
+        param_slots: list[int | None] = [None] * num_params
         # Track unresolved messages for params with provider=None
         unresolved_messages: dict[int, str] = {}
 
@@ -208,6 +603,31 @@ class Resolver:
                     compiled = self.compile(param.provider, is_async=is_async)
                     cache[param.provider.dependency_type] = compiled
                 param_resolvers[idx] = compiled.resolve
+                param_providers[idx] = current_provider or param.provider
+                if param.shared_scope:
+                    param_slots[idx] = self._get_slot(
+                        current_provider or param.provider, provider.scope
+                    )
+                if fold:
+                    dependency = current_provider or param.provider
+                    self._add_dependent(
+                        dependency.dependency_type, provider.dependency_type
+                    )
+                    folded = self._get_folded_instance(dependency)
+                    if folded is not NOT_SET:
+                        # Singleton already created, bind it as a constant
+                        inline_ns[f"_folded_{idx}"] = folded
+                        param_inlines[idx] = f"_folded_{idx}"
+                        param_providers[idx] = None
+                        continue
+                if flatten:
+                    param_inlines[idx] = self._inline_expression(
+                        current_provider or param.provider,
+                        inline_ns,
+                        is_async=is_async,
+                        cache=cache,
+                        dependent=provider.dependency_type if fold else NOT_SET,
+                    )
             else:
                 # Generate unresolved message for params without a provider
                 unresolved_messages[idx] = (
@@ -217,7 +637,18 @@ class Resolver:
                     f"scoped context."
                 )
 
+        concurrent_params: set[int] = set()
+        if self._concurrent and is_async:
+            concurrent_params = self.get_concurrent_indices(
+                [
+                    param_provider if param_inlines[idx] is None else None
+                    for idx, param_provider in enumerate(param_providers)
+                ],
+            )
+
         scope = provider.scope
+        # Singleton resources get their own exit stacks for concurrent shutdown
+        key_arg = ", _dependency_key" if scope == "singleton" else ""
         is_generator = provider.is_generator
         is_async_generator = provider.is_async_generator if is_async else False
         is_coroutine = provider.is_coroutine if is_async else False
@@ -258,6 +689,8 @@ class Resolver:
                 )
             # Cache the resolver cache for faster repeated access
             create_lines.append("    cache = _cache")
+            if concurrent_params:
+                create_lines.append("    pending = []")
 
         if not no_params:
             # Only generate parameter resolution logic if there are parameters
@@ -270,11 +703,25 @@ class Resolver:
                 )
                 create_lines.append(f"        arg_{idx} = defaults['{name}']")
                 create_lines.append("    else:")
+                inline_expr = param_inlines[idx]
+                if inline_expr is not None:
+                    # Transient subtree constructed in place or folded singleton
+                    create_lines.append(f"        arg_{idx} = {inline_expr}")
+                    continue
                 # Direct dict access for shared scope params (avoids method call)
-                if param_shared_scopes[idx]:
+                if param_slots[idx] is not None:
+                    # Same scope, index the context storage by the slot
+                    create_lines.append("        cached = NOT_SET_")
+                    create_lines.append("        if context is not None:")
+                    self._add_slot_read(
+                        create_lines,
+                        target="cached",
+                        slot=f"_param_slots[{idx}]",
+                        indent="            ",
+                    )
+                elif param_shared_scopes[idx]:
                     create_lines.append(
-                        f"        cached = (context._items.get("
-                        f"_param_types[{idx}], NOT_SET_) "
+                        f"        cached = (context.get(_param_keys[{idx}], NOT_SET_) "
                         f"if context is not None else NOT_SET_)"
                     )
                 else:
@@ -294,6 +741,10 @@ class Resolver:
                             "            raise LookupError("
                             f"_unresolved_messages[{idx}])"
                         )
+                elif idx in concurrent_params:
+                    # Resolved concurrently with its siblings below
+                    create_lines.append(f"            arg_{idx} = NOT_SET_")
+                    create_lines.append(f"            pending.append({idx})")
                 else:
                     # Has a pre-compiled resolver, use it directly
                     create_lines.append(
@@ -315,13 +766,32 @@ class Resolver:
                 create_lines.append("        else:")
                 create_lines.append(f"            arg_{idx} = cached")
                 # Wrap dependencies if in override mode (only for override version)
-                if with_override:
+                if with_override and idx not in concurrent_params:
                     create_lines.append("    if override_mode:")
                     create_lines.append(
                         f"        arg_{idx} = resolver._wrap_for_override("
                         f"_param_types[{idx}], arg_{idx})"
                     )
 
+            if concurrent_params:
+                create_lines.append("    if pending:")
+                create_lines.append(
+                    "        results = await _gather(container, [(_param_resolvers[i], "
+                    "context if _param_shared_scopes[i] else None) for i in pending])"
+                )
+                create_lines.append("        resolved = dict(zip(pending, results))")
+                for idx in sorted(concurrent_params):
+                    create_lines.append(
+                        f"        arg_{idx} = resolved.get({idx}, arg_{idx})"
+                    )
+                if with_override:
+                    create_lines.append("    if override_mode:")
+                    for idx in sorted(concurrent_params):
+                        create_lines.append(
+                            f"        arg_{idx} = resolver._wrap_for_override("
+                            f"_param_types[{idx}], arg_{idx})"
+                        )
+
         # Handle different provider types
         if is_async and is_coroutine:
             # Async function - call with await
@@ -383,7 +853,7 @@ class Resolver:
                 create_lines.append(
                     "        cm = _asynccontextmanager(_provider_factory)()"
                 )
-            create_lines.append("    inst = await context.aenter(cm)")
+            create_lines.append(f"    inst = await context.aenter(cm{key_arg})")
         elif is_generator:
             # Sync generator - use sync context manager
             create_lines.append("    if context is None:")
@@ -417,9 +887,11 @@ class Resolver:
                 create_lines.append("        cm = _contextmanager(_provider_factory)()")
             if is_async:
                 # In async mode, run sync context manager enter in thread
-                create_lines.append("    inst = await _run_sync(context.enter, cm)")
+                create_lines.append(
+                    f"    inst = await _run_sync(context.enter, cm{key_arg})"
+                )
             else:
-                create_lines.append("    inst = context.enter(cm)")
+                create_lines.append(f"    inst = context.enter(cm{key_arg})")
         else:
             if param_names:
                 call_args = ", ".join(
@@ -445,19 +917,24 @@ class Resolver:
                 create_lines.append(
                     "    if context is not None and _is_class and _is_acm(inst):"
                 )
-                create_lines.append("        await context.aenter(inst)")
+                create_lines.append(f"        await context.aenter(inst{key_arg})")
                 create_lines.append(
                     "    elif context is not None and _is_class and _is_cm(inst):"
                 )
-                create_lines.append("        await _run_sync(context.enter, inst)")
+                create_lines.append(
+                    f"        await _run_sync(context.enter, inst{key_arg})"
+                )
             else:
                 create_lines.append(
                     "    if context is not None and _is_class and _is_cm(inst):"
                 )
-                create_lines.append("        context.enter(inst)")
+                create_lines.append(f"        context.enter(inst{key_arg})")
 
         create_lines.append("    if context is not None and store:")
-        create_lines.append("        context._items[_dependency_type] = inst")
+        create_lines.append("        try:")
+        create_lines.append("            context._slots[_slot] = inst")
+        create_lines.append("        except IndexError:")
+        create_lines.append("            context.set_slot(_slot, inst)")
 
         # Wrap instance if in override mode (only for override version)
         if with_override:
@@ -502,55 +979,104 @@ class Resolver:
                 self._add_override_check(resolver_lines)
 
             # Fast path: check cached instance
-            resolver_lines.append("    inst = context.get(_dependency_type)")
+            self._add_slot_read(resolver_lines, indent="    ")
             resolver_lines.append("    if inst is not NOT_SET_:")
             resolver_lines.append("        return inst")
 
             if is_async:
-                resolver_lines.append("    async with context.alock():")
+                resolver_lines.append(
+                    "    async with context.alock_for(_dependency_key):"
+                )
             else:
-                resolver_lines.append("    with context.lock():")
-            resolver_lines.append("        inst = context.get(_dependency_type)")
+                resolver_lines.append("    with context.lock_for(_dependency_key):")
+            self._add_slot_read(resolver_lines, indent="        ")
             resolver_lines.append("        if inst is not NOT_SET_:")
             resolver_lines.append("            return inst")
-            self._add_create_call(
-                resolver_lines,
-                is_async=is_async,
-                with_override=with_override,
-                context="context",
-                store=True,
-                indent="        ",
-            )
+            if fold:
+                # Recompile dependents with the created instance as a constant
+                await_kw = "await " if is_async else ""
+                resolver_lines.append(
+                    f"        inst = {await_kw}_create_instance("
+                    "container, context, True, None, False)"
+                )
+                resolver_lines.append(
+                    "        resolver.invalidate_dependents(_dependency_type)"
+                )
+                resolver_lines.append("        return inst")
+            else:
+                self._add_create_call(
+                    resolver_lines,
+                    is_async=is_async,
+                    with_override=with_override,
+                    context="context",
+                    store=True,
+                    indent="        ",
+                )
         elif scope == "transient":
             # Transient scope
             if with_override:
                 self._add_override_check(resolver_lines, include_not_set=True)
 
-            self._add_create_call(
-                resolver_lines,
-                is_async=is_async,
-                with_override=with_override,
-                context="",
-                store=False,
+            inline_expr = (
+                self._inline_expression(
+                    provider,
+                    inline_ns,
+                    is_async=is_async,
+                    cache=cache,
+                    dependent=provider.dependency_type if fold else NOT_SET,
+                )
+                if flatten
+                else None
             )
+            if inline_expr is not None:
+                # Build the whole transient subtree without nested resolver calls
+                resolver_lines.append(f"    return {inline_expr}")
+            else:
+                self._add_create_call(
+                    resolver_lines,
+                    is_async=is_async,
+                    with_override=with_override,
+                    context="",
+                    store=False,
+                )
         else:
             # Custom scopes (including "request")
             if with_override:
                 self._add_override_check(resolver_lines)
 
             # Fast path: check cached instance (inline dict access for speed)
-            resolver_lines.append(
-                "    inst = context._items.get(_dependency_type, NOT_SET_)"
-            )
+            self._add_slot_read(resolver_lines, indent="    ")
             resolver_lines.append("    if inst is not NOT_SET_:")
             resolver_lines.append("        return inst")
 
+            # Single-flight creation, tasks or threads sharing the scope may race.
+            # Sync resolvers skip the lock while only the opening thread uses it.
+            indent = "        "
+            if is_async:
+                resolver_lines.append(
+                    "    async with context.alock_for(_dependency_key):"
+                )
+            else:
+                resolver_lines.append("    if context._owner == _get_ident():")
+                self._add_create_call(
+                    resolver_lines,
+                    is_async=is_async,
+                    with_override=with_override,
+                    context="context",
+                    store=True,
+                    indent=indent,
+                )
+                resolver_lines.append("    with context.lock_for(_dependency_key):")
+            self._add_slot_read(resolver_lines, indent=indent)
+            resolver_lines.append("        if inst is not NOT_SET_:")
+            resolver_lines.append("            return inst")
             self._add_create_call(
                 resolver_lines,
                 is_async=is_async,
                 with_override=with_override,
                 context="context",
                 store=True,
+                indent=indent,
             )
 
         create_resolver_lines: list[str] = []
@@ -605,14 +1131,18 @@ class Resolver:
 
         ns: dict[str, Any] = {
             "_dependency_type": provider.dependency_type,
+            "_dependency_key": intern_key(provider.dependency_type),
+            "_slot": self._get_slot(provider, scope),
             "_dependency_repr": type_repr(provider.dependency_type),
             "_provider_factory": provider.factory,
             "_is_class": provider.is_class,
             "_param_types": param_types,
+            "_param_keys": [intern_key(param_type) for param_type in param_types],
             "_param_defaults": param_defaults,
             "_param_has_default": param_has_default,
             "_param_resolvers": param_resolvers,
             "_param_shared_scopes": param_shared_scopes,
+            "_param_slots": param_slots,
             "_unresolved_messages": unresolved_messages,
             "_NOT_SET": NOT_SET,
             "_contextmanager": contextlib.contextmanager,
@@ -624,6 +1154,7 @@ class Resolver:
             ),
             "_compile": self._compile_resolver,
             "resolver": self,
+            **inline_ns,
         }
 
         # For custom scopes, cache the ContextVar to avoid dictionary lookups
@@ -636,16 +1167,86 @@ class Resolver:
         if is_async:
             ns["_asynccontextmanager"] = contextlib.asynccontextmanager
             ns["_is_acm"] = is_async_context_manager
-            ns["_run_sync"] = anyio.to_thread.run_sync
+            ns["_run_sync"] = run_sync
+            ns["_gather"] = gather
         else:
             ns["_is_async"] = provider.is_async
+            ns["_get_ident"] = threading.get_ident
 
-        exec(src, ns)
+        self._exec(src, ns)
         resolver = ns["_resolver"]
         creator = ns["_resolver_create"]
 
         return CompiledResolver(resolver, creator)
 
+    def _inline_expression(  # noqa: C901
+        self,
+        provider: Provider,
+        ns: dict[str, Any],
+        *,
+        is_async: bool,
+        cache: dict[Any, CompiledResolver],
+        dependent: Any = NOT_SET,
+    ) -> str | None:
+        """Build an expression that constructs a transient provider in place.
+
+        Transient dependencies are inlined recursively, while dependencies with
+        a cached scope keep calling their compiled resolver. When a dependent is
+        given, created singletons are bound as constants and tracked against it.
+        Returns None when the provider cannot be inlined.
+        """
+        if (
+            provider.scope != "transient"
+            or provider.from_context
+            or provider.is_generator
+            or provider.is_async_generator
+            or (provider.is_async and not is_async)
+        ):
+            return None
+
+        def bind(value: Any) -> str:
+            name = f"_inline_{len(ns)}"
+            ns[name] = value
+            return name
+
+        args: list[str] = []
+        for param in provider.parameters:
+            if param.provider is None:
+                if not param.has_default:
+                    return None
+                args.append(f"{param.name}={bind(param.default)}")
+                continue
+
+            current_provider = (
+                self._container.providers.get(param.dependency_type) or param.provider
+            )
+            if dependent is not NOT_SET:
+                self._add_dependent(current_provider.dependency_type, dependent)
+                folded = self._get_folded_instance(current_provider)
+                if folded is not NOT_SET:
+                    args.append(f"{param.name}={bind(folded)}")
+                    continue
+            expr = self._inline_expression(
+                current_provider,
+                ns,
+                is_async=is_async,
+                cache=cache,
+                dependent=dependent,
+            )
+            if expr is None:
+                compiled = cache.get(current_provider.dependency_type)
+                if compiled is None:
+                    compiled = self.compile(param.provider, is_async=is_async)
+                expr = f"{bind(compiled.resolve)}(container, None)"
+                if is_async:
+                    expr = f"(await {expr})"
+            args.append(f"{param.name}={expr}")
+
+        expr = f"{bind(provider.factory)}({', '.join(args)})"
+        if is_async and provider.is_coroutine:
+            expr = f"(await {expr})"
+        return expr
+
     def _compile_from_context_resolver(
         self, provider: Provider, *, is_async: bool, with_override: bool = False
     ) -> CompiledResolver:
@@ -682,9 +1283,7 @@ class Resolver:
             self._add_override_check(resolver_lines)
 
         # Check if instance is set in context
-        resolver_lines.append(
-            "    inst = context._items.get(_dependency_type, NOT_SET_)"
-        )
+        self._add_slot_read(resolver_lines, indent="    ")
         resolver_lines.append("    if inst is NOT_SET_:")
         resolver_lines.append(
             f"        raise LookupError("
@@ -716,6 +1315,8 @@ class Resolver:
 
         ns: dict[str, Any] = {
             "_dependency_type": provider.dependency_type,
+            "_dependency_key": intern_key(provider.dependency_type),
+            "_slot": self._get_slot(provider, scope),
             "_NOT_SET": NOT_SET,
             "_scoped_context_var": self._container._get_scoped_context_var(  # type: ignore[reportPrivateUsage]
                 scope
@@ -723,7 +1324,7 @@ class Resolver:
             "resolver": self,
         }
 
-        exec(src, ns)
+        self._exec(src, ns)
         resolver = ns["_resolver"]
         creator = ns["_resolver_create"]
 
@@ -765,24 +1366,30 @@ class Resolver:
         # Attach the resolver getter to the instance
         instance.__resolver_getter__ = __resolver_getter__
 
-        if not hasattr(instance.__class__, "__getattribute_patched__"):
+        with _patch_lock:
+            if not hasattr(instance.__class__, "__getattribute_patched__"):
+                self._patch_getattribute(instance.__class__)
 
-            def __getattribute__(_self: Any, name: str) -> Any:
-                # Skip the resolver getter
-                if name in {"__resolver_getter__", "__class__"}:
-                    return object.__getattribute__(_self, name)
+        return instance
 
-                if hasattr(_self, "__resolver_getter__"):
-                    try:
-                        return _self.__resolver_getter__(name)
-                    except LookupError:
-                        pass
+    @staticmethod
+    def _patch_getattribute(instance_type: Any) -> None:
+        """Patch a class to look up wrapped attributes through the resolver."""
 
-                # Fall back to default behavior
+        def __getattribute__(_self: Any, name: str) -> Any:
+            # Skip the resolver getter
+            if name in {"__resolver_getter__", "__class__"}:
                 return object.__getattribute__(_self, name)
 
-            # Apply the patched resolver if wrapped attributes exist
-            instance.__class__.__getattribute__ = __getattribute__
-            instance.__class__.__getattribute_patched__ = True
+            if hasattr(_self, "__resolver_getter__"):
+                try:
+                    return _self.__resolver_getter__(name)
+                except LookupError:
+                    pass
 
-        return instance
+            # Fall back to default behavior
+            return object.__getattribute__(_self, name)
+
+        # Apply the patched resolver if wrapped attributes exist
+        instance_type.__getattribute__ = __getattribute__
+        instance_type.__getattribute_patched__ = True
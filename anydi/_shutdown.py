@@ -0,0 +1,153 @@
+"""Concurrent shutdown of singleton resources."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple
+
+import anyio
+
+from ._backend import run_sync
+from ._context import InstanceContext
+from ._types import intern_key
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import BaseExceptionGroup
+
+_Stack = contextlib.ExitStack | contextlib.AsyncExitStack
+
+
+class ResourceShutdown(NamedTuple):
+    """Outcome of closing a single resource."""
+
+    dependency_type: Any
+    duration: float
+    timed_out: bool
+
+
+class ShutdownReport(NamedTuple):
+    """Outcome of closing the singleton resources of a container."""
+
+    duration: float
+    resources: list[ResourceShutdown]
+
+    @property
+    def timed_out(self) -> list[Any]:
+        """Get the dependency types of the resources that did not close in time."""
+        return [item.dependency_type for item in self.resources if item.timed_out]
+
+    def slowest(self, count: int = 5) -> list[ResourceShutdown]:
+        """Get the resources that took the longest to close."""
+        return sorted(self.resources, key=lambda item: item.duration, reverse=True)[
+            :count
+        ]
+
+
+async def close_resources(
+    context: InstanceContext,
+    stacks: Mapping[Any, _Stack],
+    waves: Sequence[Sequence[Any]],
+    *,
+    timeout: float | None = None,
+    timeouts: Mapping[Any, float] | None = None,
+) -> ShutdownReport:
+    """Close the resource stacks of a context wave by wave, in reverse order.
+
+    A wave with a single resource is closed in the calling task. Resources of a
+    larger wave are closed concurrently in child tasks, in reverse order of the
+    wave. Each resource is given the time left until the global `timeout`, or
+    its own deadline from `timeouts` if that is shorter. A resource that does
+    not close in time is abandoned and reported as timed out. Resources without
+    a deadline are closed outside of any cancel scope. Errors are raised once
+    all resources are closed.
+    """
+    started = time.perf_counter()
+    deadline = None if timeout is None else anyio.current_time() + timeout
+    stacks = dict(stacks)
+    resources: list[ResourceShutdown] = []
+    errors: list[BaseException] = []
+
+    for wave in reversed(waves):
+        items = [
+            (dependency_type, stacks.pop(intern_key(dependency_type)))
+            for dependency_type in reversed(wave)
+            if intern_key(dependency_type) in stacks
+        ]
+        await _close_wave(items, deadline, timeouts, resources, errors)
+
+    # Stacks outside of the waves are still exited with the context
+    await context.aclose()
+
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise BaseExceptionGroup("Failed to close resources", errors)
+    return ShutdownReport(time.perf_counter() - started, resources)
+
+
+async def _close_wave(
+    items: Sequence[tuple[Any, _Stack]],
+    deadline: float | None,
+    timeouts: Mapping[Any, float] | None,
+    resources: list[ResourceShutdown],
+    errors: list[BaseException],
+) -> None:
+    """Close the resources of a wave, concurrently if there are several."""
+    if len(items) <= 1:
+        for dependency_type, stack in items:
+            await _close_resource(
+                dependency_type, stack, deadline, timeouts, resources, errors
+            )
+        return
+    async with anyio.create_task_group() as tg:
+        for dependency_type, stack in items:
+            tg.start_soon(
+                _close_resource,
+                dependency_type,
+                stack,
+                deadline,
+                timeouts,
+                resources,
+                errors,
+            )
+
+
+async def _close_resource(
+    dependency_type: Any,
+    stack: _Stack,
+    deadline: float | None,
+    timeouts: Mapping[Any, float] | None,
+    resources: list[ResourceShutdown],
+    errors: list[BaseException],
+) -> None:
+    """Close the stack of a resource within its deadline and record the outcome."""
+    limit = timeouts.get(dependency_type) if timeouts else None
+    if deadline is not None:
+        remaining = max(deadline - anyio.current_time(), 0)
+        limit = remaining if limit is None else min(limit, remaining)
+    started = time.perf_counter()
+    timed_out = False
+    if limit is None:
+        # No cancel scope, the resource may exit scopes held across `yield`
+        await _close_stack(stack, errors)
+    else:
+        with anyio.move_on_after(limit) as scope:
+            await _close_stack(stack, errors)
+        timed_out = scope.cancelled_caught
+    resources.append(
+        ResourceShutdown(dependency_type, time.perf_counter() - started, timed_out)
+    )
+
+
+async def _close_stack(stack: _Stack, errors: list[BaseException]) -> None:
+    """Close a stack, collecting the error instead of raising it."""
+    try:
+        if isinstance(stack, contextlib.AsyncExitStack):
+            await stack.aclose()
+        else:
+            await run_sync(stack.close, abandon_on_cancel=True)
+    except Exception as exc:
+        errors.append(exc)
@@ -3,17 +3,60 @@
 from __future__ import annotations
 
 import inspect
+import weakref
 from collections.abc import AsyncIterator, Iterator
-from types import NoneType
+from types import GenericAlias, NoneType
 from typing import Any, Literal
 
-from typing_extensions import Sentinel
+from typing_extensions import Sentinel, type_repr
 
 Scope = Literal["transient", "singleton", "request"] | str
 
 NOT_SET = Sentinel("NOT_SET")
 
 
+class DependencyKey:
+    """Canonical token that stands in for a non-class dependency type."""
+
+    __slots__ = ("dependency_type", "__weakref__")
+
+    def __init__(self, dependency_type: Any) -> None:
+        self.dependency_type = dependency_type
+
+    def __repr__(self) -> str:
+        return f"DependencyKey({type_repr(self.dependency_type)})"
+
+
+_dependency_keys: weakref.WeakValueDictionary[Any, DependencyKey] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def intern_key(dependency_type: Any) -> Any:
+    """Get the key used to store instances of a dependency type.
+
+    Classes hash by identity and are used as is. `Annotated` and parameterized
+    generic types are expensive to hash and compare, so they are mapped to a
+    shared `DependencyKey` token once. Interning a key returns it unchanged.
+
+    A token lives as long as something references it, such as the slot tables,
+    contexts and resolvers of a container, and is then dropped from the table.
+    Interning the same type again afterwards creates a new token.
+    """
+    if isinstance(dependency_type, type) and not isinstance(
+        dependency_type, GenericAlias
+    ):
+        return dependency_type
+    if isinstance(dependency_type, DependencyKey):
+        return dependency_type
+    key = _dependency_keys.get(dependency_type)
+    if key is None:
+        key = _dependency_keys.setdefault(
+            dependency_type, DependencyKey(dependency_type)
+        )
+    return key
+
+
 class Event:
     """Represents an event object."""
 
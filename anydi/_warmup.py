@@ -0,0 +1,98 @@
+"""Readiness of singletons created ahead of their first use."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections.abc import Generator, Iterable
+from typing import Any
+
+from ._backend import ThreadsafeEvent
+
+
+class Warmup:
+    """Readiness of singletons created in the background.
+
+    The state can be polled with `ready`, waited for with `wait()` from sync
+    code, or awaited from async code. Awaiting returns the same as `ready`.
+    Async waiters are woken up on their event loop when the warm-up finishes.
+    """
+
+    __slots__ = (
+        "dependency_types",
+        "_event",
+        "_lock",
+        "_waiters",
+        "_error",
+        "_duration",
+    )
+
+    def __init__(self, dependency_types: Iterable[Any]) -> None:
+        self.dependency_types = tuple(dependency_types)
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters: list[ThreadsafeEvent] = []
+        self._error: Exception | None = None
+        self._duration: float | None = None
+
+    @property
+    def done(self) -> bool:
+        """Check if the warm-up has finished, successfully or not."""
+        return self._event.is_set()
+
+    @property
+    def ready(self) -> bool:
+        """Check if all selected singletons have been created."""
+        return self._event.is_set() and self._error is None
+
+    @property
+    def error(self) -> Exception | None:
+        """Get the error that stopped the warm-up, if any."""
+        return self._error
+
+    @property
+    def duration(self) -> float | None:
+        """Get the duration of the warm-up in seconds."""
+        return self._duration
+
+    def complete(self, duration: float, error: Exception | None = None) -> None:
+        """Mark the warm-up as finished."""
+        self._duration = duration
+        self._error = error
+        with self._lock:
+            self._event.set()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the warm-up has finished and return if it succeeded."""
+        self._event.wait(timeout)
+        return self.ready
+
+    def __await__(self) -> Generator[Any, None, bool]:
+        return self._wait().__await__()
+
+    async def _wait(self) -> bool:
+        if self._event.is_set():
+            return self.ready
+        waiter = ThreadsafeEvent()
+        with self._lock:
+            if self._event.is_set():
+                return self.ready
+            self._waiters.append(waiter)
+        try:
+            await waiter.wait()
+        finally:
+            with self._lock, contextlib.suppress(ValueError):
+                self._waiters.remove(waiter)
+        return self.ready
+
+    def __repr__(self) -> str:
+        if not self.done:
+            state = "pending"
+        elif self.ready:
+            state = "ready"
+        else:
+            state = "failed"
+        return f"Warmup({state}, {len(self.dependency_types)} singletons)"
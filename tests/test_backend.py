@@ -0,0 +1,150 @@
+import asyncio
+import contextvars
+import threading
+
+import anyio
+import pytest
+
+from anydi import Container
+from anydi._async_lock import AsyncRLock
+from anydi._backend import (
+    ThreadsafeEvent,
+    create_lock,
+    current_task,
+    is_asyncio,
+    run_sync,
+)
+
+from tests.fixtures import Resource
+
+backends = pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+
+var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+
+
+def test_is_asyncio_outside_event_loop() -> None:
+    assert not is_asyncio()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_asyncio_fast_path() -> None:
+    assert is_asyncio()
+    assert current_task() is asyncio.current_task()
+    assert isinstance(create_lock(), asyncio.Lock)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["trio"])
+async def test_trio_uses_anyio() -> None:
+    assert not is_asyncio()
+    assert current_task() == anyio.get_current_task()
+    assert isinstance(create_lock(), anyio.Lock)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_run_sync_in_worker_thread() -> None:
+    var.set("value")
+
+    def work(a: int, b: int) -> tuple[int, str, bool]:
+        is_main = threading.current_thread() is threading.main_thread()
+        return a + b, var.get(), is_main
+
+    assert await run_sync(work, 1, 2) == (3, "value", False)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_run_sync_cancelled_waits_for_thread() -> None:
+    event = threading.Event()
+    finished: list[bool] = []
+
+    def work() -> None:
+        event.wait(1)
+        finished.append(True)
+
+    task = asyncio.ensure_future(run_sync(work))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    event.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert finished == [True]
+
+
+@pytest.mark.anyio
+@backends
+async def test_run_sync_cancel_scope_waits_for_thread() -> None:
+    event = threading.Event()
+    finished: list[bool] = []
+
+    def work() -> None:
+        event.wait(1)
+        finished.append(True)
+
+    timer = threading.Timer(0.1, event.set)
+    timer.start()
+
+    with anyio.move_on_after(0.01) as scope:
+        await run_sync(work)
+
+    timer.join()
+
+    assert scope.cancel_called
+    assert finished == [True]
+
+
+@pytest.mark.anyio
+@backends
+async def test_threadsafe_event_set_from_thread() -> None:
+    event = ThreadsafeEvent()
+    thread = threading.Timer(0.01, event.set)
+    thread.start()
+
+    with anyio.fail_after(5):
+        await event.wait()
+
+    thread.join()
+
+
+@pytest.mark.anyio
+@backends
+async def test_async_rlock_serializes_tasks() -> None:
+    lock = AsyncRLock()
+    events: list[str] = []
+
+    async def worker(name: str) -> None:
+        async with lock:
+            async with lock:
+                events.append(f"{name}-in")
+                await anyio.sleep(0.01)
+                events.append(f"{name}-out")
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(worker, "a")
+        tg.start_soon(worker, "b")
+
+    assert events in (
+        ["a-in", "a-out", "b-in", "b-out"],
+        ["b-in", "b-out", "a-in", "a-out"],
+    )
+
+
+@pytest.mark.anyio
+@backends
+async def test_container_aresolve_on_backend() -> None:
+    container = Container()
+
+    @container.provider(scope="singleton")
+    def provide_resource() -> Resource:
+        return Resource()
+
+    results: list[Resource] = []
+    async with container:
+        results = await container.aresolve_many([Resource, Resource])
+
+    assert results[0] is results[1]
@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import anyio
 import pytest
@@ -390,3 +391,26 @@ def test_benchmark_inject_request_async(
 
     result = benchmark(lambda: anyio.run(run_in_context))
     assert result == "hello world"
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4, 8])
+def test_benchmark_transient_scope_threaded(
+    benchmark: BenchmarkFixture, container_transient: Container, threads: int
+) -> None:
+    """Benchmark resolve throughput with transient scope across threads.
+
+    Every thread resolves the same number of instances, so on free-threaded
+    Python the timing should stay flat as the number of threads grows.
+    """
+    container_transient.resolve(Application)
+
+    def worker() -> None:
+        for _ in range(1000):
+            container_transient.resolve(Application)
+
+    def resolve() -> None:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(worker) for _ in range(threads)]:
+                future.result()
+
+    benchmark(resolve)
@@ -1,12 +1,17 @@
 """Tests for the AnyDI CLI module."""
 
+import types
+from pathlib import Path
+from typing import Any
 from unittest import mock
 
 import pytest
 
-from anydi import Container
+from anydi import Container, Inject
 from anydi._cli import main
 
+from tests.fixtures import Resource, Service
+
 
 class TestCLIMain:
     """Tests for the CLI main function."""
@@ -56,6 +61,39 @@ class TestCLIMain:
             ident=2,
         )
 
+    def test_main_graph_command(self) -> None:
+        """Test that the explicit graph command accepts a path named `compile`."""
+        container = Container()
+        container.graph = mock.MagicMock(return_value="graph output")
+
+        with (
+            mock.patch("sys.argv", ["anydi", "graph", "compile"]),
+            mock.patch(
+                "anydi._cli.import_container", return_value=container
+            ) as import_container,
+        ):
+            main()
+
+        import_container.assert_called_once_with("compile")
+        container.graph.assert_called_once_with(
+            output_format="tree",
+            full_path=False,
+            ident=2,
+        )
+
+    def test_main_help_lists_commands(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that the help output lists the subcommands."""
+        with (
+            mock.patch("sys.argv", ["anydi", "--help"]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert "graph" in out
+        assert "compile" in out
+
     def test_main_with_scan_option(self) -> None:
         """Test main with --scan option."""
         container = Container()
@@ -170,3 +208,149 @@ class TestCLIMain:
         captured = capsys.readouterr()
         assert "Error:" in captured.err
         assert "Missing dependency" in captured.err
+
+
+class TestCLICompile:
+    """Tests for the compile subcommand."""
+
+    @staticmethod
+    def create_container() -> Container:
+        container = Container()
+        container.register(Resource, scope="singleton")
+        container.register(Service, lambda: Service(ident="1"), scope="transient")
+        return container
+
+    def test_compile_writes_module(self, tmp_path: Path) -> None:
+        """Test that compile writes a module which the container can load."""
+        output = tmp_path / "resolvers.py"
+
+        with (
+            mock.patch(
+                "sys.argv",
+                ["anydi", "compile", "mymodule:container", "-o", str(output)],
+            ),
+            mock.patch(
+                "anydi._cli.import_container", return_value=self.create_container()
+            ),
+        ):
+            main()
+
+        module = types.ModuleType("resolvers")
+        exec(compile(output.read_text(), str(output), "exec"), module.__dict__)
+
+        container = self.create_container()
+        container.build()
+        container.load_resolvers(module)
+
+        assert isinstance(container.resolve(Resource), Resource)
+        assert container.resolve(Service).ident == "1"
+        compiled = container._resolver.get_cached(Service, is_async=False)
+        assert compiled is not None
+        assert compiled.resolve.__code__.co_filename == str(output)
+
+    def test_compile_prints_module(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that compile prints the module when no output file is given."""
+        with (
+            mock.patch("sys.argv", ["anydi", "compile", "mymodule:container"]),
+            mock.patch(
+                "anydi._cli.import_container", return_value=self.create_container()
+            ),
+        ):
+            main()
+
+        captured = capsys.readouterr()
+        assert "RESOLVERS = {" in captured.out
+        assert "class tests_fixtures_Service__sync:" in captured.out
+
+    def test_compile_container_named_compile(self) -> None:
+        """Test that a container path named `compile` can be compiled."""
+        with (
+            mock.patch("sys.argv", ["anydi", "compile", "compile"]),
+            mock.patch(
+                "anydi._cli.import_container", return_value=self.create_container()
+            ) as import_container,
+        ):
+            main()
+
+        import_container.assert_called_once_with("compile")
+
+    def test_compile_with_build_error(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test compile exits with error when the container cannot be built."""
+        container = Container()
+        container.build = mock.MagicMock(side_effect=LookupError("Missing `db`"))
+
+        with (
+            mock.patch("sys.argv", ["anydi", "compile", "mymodule:container"]),
+            mock.patch("anydi._cli.import_container", return_value=container),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 1
+        assert "Missing `db`" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"flatten_resolvers": True},
+            {"fold_singletons": True},
+            {"concurrent_resolution": True},
+        ],
+    )
+    async def test_loaded_module_needs_no_exec(self, options: dict[str, Any]) -> None:
+        """Test that resolving with a loaded module never generates code."""
+
+        def create_container() -> Container:
+            container = Container(**options)
+            container.register(Resource, scope="singleton")
+
+            @container.provider(scope="transient")
+            def provide_service(resource: Resource) -> Service:
+                return Service(ident="1")
+
+            @container.provider(scope="singleton")
+            async def provide_ident(resource: Resource) -> str:
+                return "1"
+
+            @container.provider(scope="singleton")
+            async def provide_number() -> int:
+                return 1
+
+            @container.provider(scope="transient")
+            async def provide_total(ident: str, number: int) -> float:
+                return float(ident) + number
+
+            container.build()
+            return container
+
+        module = types.ModuleType("resolvers")
+        source = create_container().export_resolvers()
+        exec(compile(source, "resolvers.py", "exec"), module.__dict__)
+
+        container = create_container()
+        container.load_resolvers(module)
+
+        with (
+            mock.patch(
+                "anydi._resolver.compile", create=True, side_effect=AssertionError
+            ),
+            mock.patch("anydi._injector.exec", create=True, side_effect=AssertionError),
+        ):
+
+            @container.inject
+            def handler(service: Service = Inject()) -> str:
+                return service.ident
+
+            @container.inject
+            async def ahandler(ident: str = Inject()) -> str:
+                return ident
+
+            for _ in range(2):
+                assert isinstance(container.resolve(Resource), Resource)
+                assert container.resolve(Service).ident == "1"
+                assert (await container.aresolve(Service)).ident == "1"
+                assert await container.aresolve(str) == "1"
+                assert await container.aresolve(float) == 2.0
+                assert handler() == "1"
+                assert await ahandler() == "1"
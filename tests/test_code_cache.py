@@ -0,0 +1,96 @@
+import importlib.metadata
+import logging
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from anydi import Container
+from anydi._code_cache import CodeCache, get_anydi_version
+
+from tests.fixtures import Resource, Service
+
+
+def create_container(cache_dir: Path) -> Container:
+    container = Container(code_cache_dir=cache_dir)
+    container.register(Resource, scope="singleton")
+    container.register(Service, lambda: Service(ident="1"), scope="transient")
+    return container
+
+
+class TestCodeCache:
+    def test_precompile_writes_cache_file(self, tmp_path: Path) -> None:
+        container = create_container(tmp_path)
+        container.build(precompile=True)
+
+        code_cache = container._resolver._code_cache
+        assert code_cache is not None
+        assert code_cache.path is not None
+        assert code_cache.path.exists()
+        assert code_cache.path.parent == tmp_path
+
+    def test_cached_code_is_reused(self, tmp_path: Path) -> None:
+        create_container(tmp_path).build(precompile=True)
+
+        container = create_container(tmp_path)
+        with mock.patch("anydi._code_cache.compile") as compile_mock:
+            container.build(precompile=True)
+
+        compile_mock.assert_not_called()
+        assert isinstance(container.resolve(Resource), Resource)
+        assert container.resolve(Service).ident == "1"
+
+    def test_different_graph_uses_different_file(self, tmp_path: Path) -> None:
+        first = create_container(tmp_path)
+        first.build(precompile=True)
+
+        second = Container(code_cache_dir=tmp_path)
+        second.register(Resource, scope="transient")
+        second.build(precompile=True)
+
+        assert first._resolver._code_cache is not None
+        assert second._resolver._code_cache is not None
+        assert first._resolver._code_cache.path != second._resolver._code_cache.path
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_corrupted_cache_file_is_ignored(self, tmp_path: Path) -> None:
+        container = create_container(tmp_path)
+        container.build(precompile=True)
+
+        code_cache = container._resolver._code_cache
+        assert code_cache is not None
+        assert code_cache.path is not None
+        code_cache.path.write_bytes(b"corrupted")
+
+        container = create_container(tmp_path)
+        container.build(precompile=True)
+
+        assert isinstance(container.resolve(Resource), Resource)
+
+    def test_save_without_changes(self, tmp_path: Path) -> None:
+        code_cache = CodeCache(tmp_path)
+
+        assert code_cache.save() is False
+
+        code_cache.load("graph")
+
+        assert code_cache.save() is False
+        assert not list(tmp_path.iterdir())
+
+    def test_save_failure_is_logged(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        container = create_container(tmp_path / "file")
+        (tmp_path / "file").write_text("not a directory")
+
+        with caplog.at_level(logging.WARNING, logger="anydi._container"):
+            container.build(precompile=True)
+
+        assert "Failed to save resolver code cache" in caplog.text
+
+    def test_get_anydi_version_not_installed(self) -> None:
+        with mock.patch(
+            "importlib.metadata.version",
+            side_effect=importlib.metadata.PackageNotFoundError,
+        ):
+            assert get_anydi_version() == "unknown"
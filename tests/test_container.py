@@ -1,13 +1,18 @@
 import asyncio
+import contextvars
 import inspect
 import logging
+import sys
 import threading
+import time
+import types
 import uuid
 from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 from typing import Annotated, Any
 from unittest import mock
 
+import anyio
 import pytest
 from typing_extensions import Self
 
@@ -1124,6 +1129,129 @@ class TestContainerBuild:
         # Verify both services work
         assert isinstance(container.resolve(ServiceY), ServiceY)
 
+    def test_build_precompile(self, caplog: pytest.LogCaptureFixture) -> None:
+        container = Container()
+        container.register(Resource, scope="singleton")
+        container.register(Service, lambda: Service(ident="1"), scope="transient")
+
+        with caplog.at_level(logging.INFO, logger="anydi._container"):
+            container.build(precompile=True)
+
+        resolver = container._resolver
+        for dependency_type in (Resource, Service, Container):
+            assert dependency_type in resolver._cache
+            assert dependency_type in resolver._async_cache
+        assert container.precompile_duration is not None
+        assert "Precompiled resolvers for 3 providers" in caplog.text
+
+    def test_build_precompile_in_background(self) -> None:
+        container = Container()
+        container.register(Resource, scope="singleton")
+
+        container.build(precompile=True, background=True)
+
+        assert container.wait_precompiled(5)
+        assert Resource in container._resolver._cache
+        assert Resource in container._resolver._async_cache
+        assert container.precompile_duration is not None
+        assert isinstance(container.resolve(Resource), Resource)
+
+    def test_build_without_precompile(self) -> None:
+        container = Container()
+        container.register(Resource, scope="singleton")
+
+        container.build()
+
+        assert Resource not in container._resolver._cache
+        assert container.precompile_duration is None
+
+    def test_precompile_failure_is_raised(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        container = Container()
+        container.build()
+
+        with (
+            mock.patch.object(
+                container._resolver, "precompile", side_effect=RuntimeError("boom")
+            ),
+            caplog.at_level(logging.ERROR, logger="anydi._container"),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            container.precompile()
+
+        assert "Failed to precompile resolvers." in caplog.text
+        assert container.precompile_duration is None
+        assert not container.wait_precompiled(0)
+
+    def test_precompile_failure_in_background_is_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        container = Container()
+        container.build()
+
+        with (
+            mock.patch.object(
+                container._resolver, "precompile", side_effect=RuntimeError("boom")
+            ),
+            caplog.at_level(logging.ERROR, logger="anydi._container"),
+        ):
+            container.precompile(background=True)
+            assert not container.wait_precompiled(5)
+
+        assert "Failed to precompile resolvers." in caplog.text
+        assert container.precompile_duration is None
+
+    def test_precompile_requires_build(self) -> None:
+        container = Container()
+        container.register(Resource, scope="singleton")
+
+        @container.provider(scope="transient")
+        def provide_service(resource: Resource) -> Service:
+            return Service(ident="1")
+
+        with pytest.raises(RuntimeError, match="Container must be built"):
+            container.precompile()
+
+        container.build()
+
+        assert container.resolve(Service).ident == "1"
+
+    def test_wait_precompiled_without_precompile(self) -> None:
+        container = Container()
+        container.build()
+
+        assert not container.wait_precompiled()
+
+    def test_export_resolvers_requires_build(self) -> None:
+        container = Container()
+
+        with pytest.raises(
+            RuntimeError, match="Container must be built before exporting resolvers"
+        ):
+            container.export_resolvers()
+
+    def test_load_resolvers_from_module_name(self) -> None:
+        container = Container()
+        container.register(Resource, scope="singleton")
+        container.build()
+
+        module = types.ModuleType("tests.generated_resolvers")
+        exec(container.export_resolvers(), module.__dict__)
+
+        with mock.patch.dict(sys.modules, {module.__name__: module}):
+            container.load_resolvers(module.__name__)
+
+        assert isinstance(container.resolve(Resource), Resource)
+
+    def test_load_resolvers_invalid_module(self) -> None:
+        container = Container()
+
+        with pytest.raises(
+            TypeError, match="Module `types` does not define a `RESOLVERS` mapping"
+        ):
+            container.load_resolvers(types)
+
 
 class TestContainerResolution:
     """Tests for container Resolution functionality."""
@@ -1204,6 +1332,139 @@ class TestContainerResolution:
 
         assert len(unique_ids) == 1
 
+    def test_resolve_unrelated_singletons_in_parallel(
+        self, container: Container
+    ) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        @container.provider(scope="singleton")
+        def provide_int() -> int:
+            barrier.wait()
+            return 1
+
+        @container.provider(scope="singleton")
+        def provide_str() -> str:
+            barrier.wait()
+            return "a"
+
+        results: dict[Any, Any] = {}
+
+        def resolve(dependency_type: Any) -> None:
+            results[dependency_type] = container.resolve(dependency_type)
+
+        threads = [threading.Thread(target=resolve, args=(tp,)) for tp in (int, str)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert results == {int: 1, str: "a"}
+        assert not barrier.broken
+
+    def test_resolve_nested_singletons_thread_safe(self, container: Container) -> None:
+        @container.provider(scope="singleton")
+        def provide_unique_id() -> UniqueId:
+            return UniqueId()
+
+        @container.provider(scope="singleton")
+        def provide_ids(unique_id: UniqueId) -> list[UniqueId]:
+            return [unique_id]
+
+        results: list[Any] = []
+
+        def resolve() -> None:
+            results.append(container.resolve(list[UniqueId])[0])
+            results.append(container.resolve(UniqueId))
+
+        threads = [threading.Thread(target=resolve) for _ in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 20
+        assert len({id(result) for result in results}) == 1
+
+    def test_first_resolve_compiles_once_across_threads(
+        self, container: Container
+    ) -> None:
+        container.register(Service, lambda: Service(ident="1"), scope="transient")
+        barrier = threading.Barrier(8, timeout=5)
+        compiled: list[Any] = []
+
+        def resolve() -> None:
+            barrier.wait()
+            container.resolve(Service)
+            compiled.append(container._resolver._cache[Service])
+
+        threads = [threading.Thread(target=resolve) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len({id(item) for item in compiled}) == 1
+
+    def test_request_scoped_instance_shared_across_threads(
+        self, container: Container
+    ) -> None:
+        calls: list[int] = []
+
+        @container.provider(scope="request")
+        def provide_unique_id() -> UniqueId:
+            calls.append(1)
+            time.sleep(0.01)
+            return UniqueId()
+
+        results: list[UniqueId] = []
+
+        with container.request_context():
+            threads = [
+                threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(lambda: results.append(container.resolve(UniqueId)),),
+                )
+                for _ in range(5)
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+        assert calls == [1]
+        assert len(results) == 5
+        assert len({id(result) for result in results}) == 1
+
+    def test_request_scoped_instance_locked_only_when_shared(
+        self, container: Container
+    ) -> None:
+        container.register(UniqueId, scope="request")
+        container.register(Service, lambda: Service(ident="1"), scope="request")
+
+        with container.request_context() as context:
+            container.resolve(UniqueId)
+
+            assert context._locks is None
+
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(lambda: container.resolve(Service),),
+            )
+            thread.start()
+            thread.join()
+
+            assert context._owner is None
+            assert context._locks is not None
+            assert container.resolve(Service) is context.get(Service)
+
     async def test_resolve_singleton_async_resource(self, container: Container) -> None:
         instance = "test"
 
@@ -2011,6 +2272,93 @@ class TestContainerResolution:
         with pytest.raises(ValueError, match="Circular dependency"):
             container.resolve(SelfRef)
 
+    def test_resolve_many(self, container: Container) -> None:
+        container.register(int, lambda: 1, scope="singleton")
+        container.register(str, lambda: "a", scope="transient")
+
+        assert container.resolve_many([int, str]) == [1, "a"]
+        assert container.resolve_many((str, int, str)) == ["a", 1, "a"]
+
+    def test_resolve_many_plan_is_cached(self, container: Container) -> None:
+        container.register(int, lambda: 1, scope="singleton")
+
+        container.resolve_many([int])
+        plan = container._plans[(int,), False]
+        container.resolve_many([int])
+
+        assert container._plans[(int,), False] is plan
+
+        with container.test_mode(), container.override(int, 2):
+            assert container.resolve_many([int]) == [2]
+
+        assert container.resolve_many([int]) == [1]
+
+    async def test_aresolve_many(self, container: Container) -> None:
+        stats = {"active": 0, "max_active": 0}
+
+        async def wait_and_return(value: Any) -> Any:
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            await anyio.sleep(0.01)
+            stats["active"] -= 1
+            return value
+
+        @container.provider(scope="transient")
+        async def provide_int() -> int:
+            return await wait_and_return(1)
+
+        @container.provider(scope="transient")
+        async def provide_str() -> str:
+            return await wait_and_return("a")
+
+        container.register(float, lambda: 1.5, scope="singleton")
+
+        assert await container.aresolve_many([int, float, str]) == [1, 1.5, "a"]
+        assert stats["max_active"] == 2
+        assert container._plans[(int, float, str), True].concurrent == (0, 2)
+
+    async def test_aresolve_many_sequential(self, container: Container) -> None:
+        container.register(int, lambda: 1, scope="singleton")
+        container.register(str, lambda: "a", scope="transient")
+
+        assert await container.aresolve_many([int, str]) == [1, "a"]
+        assert container._plans[(int, str), True].concurrent == ()
+
+    def test_resolver_for(self, container: Container) -> None:
+        container.register(Service, lambda: Service(ident="1"), scope="transient")
+
+        get_service = container.resolver_for(Service)
+
+        assert get_service().ident == "1"
+        assert get_service() is not get_service()
+
+    def test_resolver_for_rebinds_after_override(self, container: Container) -> None:
+        container.register(Service, lambda: Service(ident="1"), scope="transient")
+        get_service = container.resolver_for(Service)
+        service = Service(ident="override")
+
+        with container.test_mode(), container.override(Service, service):
+            assert get_service() is service
+
+        assert get_service().ident == "1"
+
+    def test_resolver_for_not_registered(self, container: Container) -> None:
+        with pytest.raises(LookupError):
+            container.resolver_for(str)
+
+    async def test_aresolver_for(self, container: Container) -> None:
+        @container.provider(scope="singleton")
+        async def provide_service() -> Service:
+            return Service(ident="1")
+
+        get_service = container.aresolver_for(Service)
+        service = Service(ident="override")
+
+        assert (await get_service()).ident == "1"
+
+        with container.test_mode(), container.override(Service, service):
+            assert await get_service() is service
+
 
 class TestContainerCreate:
     """Tests for container Create functionality."""
@@ -2052,6 +2400,97 @@ class TestContainerCreate:
 
         assert instance.name == "test"
 
+    def test_create_many(self) -> None:
+        @singleton
+        class Config:
+            pass
+
+        @transient
+        class Buffer:
+            pass
+
+        @transient
+        class Parser:
+            def __init__(self, row: int, config: Config, buffer: Buffer) -> None:
+                self.row = row
+                self.config = config
+                self.buffer = buffer
+
+        container = Container()
+
+        with mock.patch.object(
+            container, "resolve", wraps=container.resolve
+        ) as resolve_mock:
+            parsers = container.create_many(Parser, [{"row": 1}, {"row": 2}])
+
+        resolve_mock.assert_called_once_with(Config)
+        assert [parser.row for parser in parsers] == [1, 2]
+        assert parsers[0].config is parsers[1].config
+        assert parsers[0].buffer is not parsers[1].buffer
+
+    def test_create_many_empty(self) -> None:
+        container = Container()
+
+        assert container.create_many(int, []) == []
+
+    async def test_acreate_many(self) -> None:
+        stats = {"active": 0, "max_active": 0}
+
+        @singleton
+        class Config:
+            pass
+
+        class Client:
+            pass
+
+        @transient
+        class Parser:
+            def __init__(self, row: int, config: Config, client: Client) -> None:
+                self.row = row
+                self.config = config
+                self.client = client
+
+        container = Container()
+
+        @container.provider(scope="transient")
+        async def provide_client() -> Client:
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            await anyio.sleep(0.01)
+            stats["active"] -= 1
+            return Client()
+
+        parsers = await container.acreate_many(
+            Parser, ({"row": row} for row in range(5)), max_concurrency=2
+        )
+
+        assert [parser.row for parser in parsers] == [0, 1, 2, 3, 4]
+        assert all(parser.config is parsers[0].config for parser in parsers)
+        assert stats["max_active"] == 2
+
+    async def test_acreate_many_sync_subgraph(self) -> None:
+        @transient
+        class Component:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+        container = Container()
+
+        components = await container.acreate_many(
+            Component, [{"name": "a"}, {"name": "b"}]
+        )
+
+        assert [component.name for component in components] == ["a", "b"]
+        assert await container.acreate_many(Component, []) == []
+
+    async def test_acreate_many_invalid_max_concurrency(self) -> None:
+        container = Container()
+
+        with pytest.raises(
+            ValueError, match="The `max_concurrency` must be greater than 0."
+        ):
+            await container.acreate_many(int, [], max_concurrency=0)
+
     def test_create_non_existing_keyword_arg(self) -> None:
         @singleton
         class Component:
@@ -2104,109 +2543,462 @@ class TestContainerCreate:
         class Component:
             pass
 
-        container = Container()
+        container = Container()
+
+        with pytest.raises(TypeError, match="takes no arguments"):
+            await container.acreate(Component, param="test")
+
+    async def test_create_async_function_with_defaults(self) -> None:
+        """Test async function provider with parameters and defaults."""
+
+        @singleton
+        class Database:
+            def __init__(self) -> None:
+                self.name = "db"
+
+        container = Container()
+
+        @container.provider(scope="singleton")
+        async def create_service(
+            db: Database, timeout: int = 30, retries: int = 3
+        ) -> str:
+            return f"Service(db={db.name}, timeout={timeout}, retries={retries})"
+
+        # Create with custom defaults overriding the function defaults
+        result = await container.acreate(str, timeout=60, retries=5)
+
+        assert result == "Service(db=db, timeout=60, retries=5)"
+
+    def test_create_without_defaults(self) -> None:
+        """Test create without passing any defaults."""
+
+        @singleton
+        class Database:
+            def __init__(self) -> None:
+                self.name = "db"
+
+        @transient
+        class Service:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        container = Container()
+
+        # Create without any defaults - should use cached resolver
+        instance1 = container.create(Service)
+        instance2 = container.create(Service)
+
+        assert instance1.db.name == "db"
+        assert instance2.db.name == "db"
+
+        # Transient scope should create new instances
+        assert instance1 is not instance2
+        # But singleton dependency should be the same
+        assert instance1.db is instance2.db
+
+    async def test_create_async_without_defaults(self) -> None:
+        """Test acreate without passing any defaults."""
+
+        @singleton
+        class Database:
+            def __init__(self) -> None:
+                self.name = "db"
+
+        @transient
+        class Service:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        container = Container()
+
+        # Create without any defaults - should use cached resolver
+        instance1 = await container.acreate(Service)
+        instance2 = await container.acreate(Service)
+
+        assert instance1.db.name == "db"
+        assert instance2.db.name == "db"
+
+        # Transient scope should create new instances
+        assert instance1 is not instance2
+        # But singleton dependency should be the same
+        assert instance1.db is instance2.db
+
+
+class TestContainerContext:
+    """Tests for container Context functionality."""
+
+    def test_start_and_close_singleton_context(self, container: Container) -> None:
+        events = []
+
+        def dep1() -> Iterator[str]:
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        container.register(str, dep1, scope="singleton")
+
+        container.start()
+
+        assert container.resolve(str) == "test"
+
+        container.close()
+
+        assert events == ["dep1:before", "dep1:after"]
+
+    def test_start_with_max_workers(self, container: Container) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        def dep1() -> Iterator[str]:
+            barrier.wait()
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        def dep2() -> Iterator[int]:
+            barrier.wait()
+            time.sleep(0.01)
+            events.append("dep2:before")
+            yield 1
+            events.append("dep2:after")
+
+        @container.provider(scope="singleton")
+        def dep3(value: str, number: int) -> Iterator[float]:
+            events.append("dep3:before")
+            yield 1.0
+            events.append("dep3:after")
+
+        container.start(max_workers=2)
+
+        assert events == ["dep1:before", "dep2:before", "dep3:before"]
+
+        container.close()
+
+        assert events[3:] == ["dep3:after", "dep2:after", "dep1:after"]
+
+    def test_start_with_max_workers_closes_on_failure(
+        self, container: Container
+    ) -> None:
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        def dep1() -> Iterator[str]:
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        def dep2() -> Iterator[int]:
+            raise RuntimeError("failed")
+            yield 1
+
+        with pytest.raises(RuntimeError, match="failed"):
+            container.start(max_workers=2)
+
+        assert events == ["dep1:before", "dep1:after"]
+
+    def test_start_with_invalid_max_workers(self, container: Container) -> None:
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            container.start(max_workers=0)
+
+    def test_request_context(self, container: Container) -> None:
+        events = []
+
+        def dep1() -> Iterator[str]:
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        container.register(str, dep1, scope="request")
+
+        with container.request_context():
+            assert container.resolve(str) == "test"
+
+        assert events == ["dep1:before", "dep1:after"]
+
+    # Asynchronous lifespan
+
+    async def test_astart_and_aclose_singleton_context(
+        self, container: Container
+    ) -> None:
+        events = []
+
+        async def dep1() -> AsyncIterator[str]:
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        container.register(str, dep1, scope="singleton")
+
+        await container.astart()
+
+        assert container.resolve(str) == "test"
+
+        await container.aclose()
+
+        assert events == ["dep1:before", "dep1:after"]
+
+    async def test_astart_starts_independent_resources_concurrently(
+        self, container: Container
+    ) -> None:
+        started = anyio.Event()
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            await started.wait()
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        async def dep2() -> AsyncIterator[int]:
+            started.set()
+            events.append("dep2:before")
+            yield 1
+            events.append("dep2:after")
+
+        with anyio.fail_after(5):
+            await container.astart(concurrent=True)
+
+        assert events == ["dep2:before", "dep1:before"]
+
+        await container.aclose(concurrent=True)
+
+        assert events[2:] == ["dep1:after", "dep2:after"]
+
+    async def test_astart_resources_holding_task_groups(
+        self, container: Container
+    ) -> None:
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            async with anyio.create_task_group():
+                yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        async def dep2() -> AsyncIterator[int]:
+            async with anyio.create_task_group():
+                yield 1
+            events.append("dep2:after")
+
+        async with container:
+            assert await container.aresolve(str) == "test"
+
+        assert events == ["dep2:after", "dep1:after"]
+
+    async def test_astart_starts_dependencies_first(self, container: Container) -> None:
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def service(number: int) -> AsyncIterator[str]:
+            events.append("service:before")
+            yield str(number)
+            events.append("service:after")
+
+        @container.provider(scope="singleton")
+        def number(value: float) -> int:
+            return int(value)
+
+        @container.provider(scope="singleton")
+        async def value() -> AsyncIterator[float]:
+            await anyio.sleep(0.01)
+            events.append("value:before")
+            yield 1.0
+            events.append("value:after")
+
+        assert container._get_start_waves() == [[float], [str]]
+
+        await container.astart(concurrent=True)
+        assert events == ["value:before", "service:before"]
+        await container.aclose(concurrent=True)
+
+        assert events[2:] == ["service:after", "value:after"]
+
+    async def test_astart_closes_started_resources_on_failure(
+        self, container: Container
+    ) -> None:
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            events.append("dep1:before")
+            yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        async def dep2(value: str) -> AsyncIterator[int]:
+            raise RuntimeError("failed")
+            yield 1
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await container.astart()
+
+        assert events == ["dep1:before", "dep1:after"]
+
+    async def test_aclose_closes_independent_resources_concurrently(
+        self, container: Container
+    ) -> None:
+        closing = anyio.Event()
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            yield "test"
+            await closing.wait()
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        async def dep2() -> AsyncIterator[int]:
+            yield 1
+            closing.set()
+            events.append("dep2:after")
+
+        await container.astart()
+
+        with anyio.fail_after(5):
+            report = await container.aclose(concurrent=True)
+
+        assert events == ["dep2:after", "dep1:after"]
+        assert {item.dependency_type for item in report.resources} == {str, int}
+        assert report.timed_out == []
+
+    async def test_aclose_closes_dependents_first(self, container: Container) -> None:
+        events: list[str] = []
+
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            yield "test"
+            events.append("dep1:after")
+
+        @container.provider(scope="singleton")
+        def dep2(value: str) -> Iterator[int]:
+            yield 1
+            events.append("dep2:after")
+
+        async with container:
+            pass
+
+        assert events == ["dep2:after", "dep1:after"]
 
-        with pytest.raises(TypeError, match="takes no arguments"):
-            await container.acreate(Component, param="test")
+    async def test_aclose_closes_context_manager_singletons_before_dependencies(
+        self, container: Container
+    ) -> None:
+        events: list[str] = []
 
-    async def test_create_async_function_with_defaults(self) -> None:
-        """Test async function provider with parameters and defaults."""
+        class Pool:
+            pass
 
-        @singleton
-        class Database:
-            def __init__(self) -> None:
-                self.name = "db"
+        class Client:
+            def __init__(self, pool: Pool) -> None:
+                self.pool = pool
 
-        container = Container()
+            def __enter__(self) -> Self:
+                return self
+
+            def __exit__(self, *args: Any) -> None:
+                events.append("client:exit")
 
         @container.provider(scope="singleton")
-        async def create_service(
-            db: Database, timeout: int = 30, retries: int = 3
-        ) -> str:
-            return f"Service(db={db.name}, timeout={timeout}, retries={retries})"
+        async def pool() -> AsyncIterator[Pool]:
+            yield Pool()
+            events.append("pool:close")
 
-        # Create with custom defaults overriding the function defaults
-        result = await container.acreate(str, timeout=60, retries=5)
+        container.register(Client, scope="singleton")
 
-        assert result == "Service(db=db, timeout=60, retries=5)"
+        async with container:
+            await container.aresolve(Client)
 
-    def test_create_without_defaults(self) -> None:
-        """Test create without passing any defaults."""
+        assert events == ["client:exit", "pool:close"]
 
-        @singleton
-        class Database:
-            def __init__(self) -> None:
-                self.name = "db"
+    async def test_aclose_closes_single_resource_in_calling_task(
+        self, container: Container
+    ) -> None:
+        events: list[str] = []
 
-        @transient
-        class Service:
-            def __init__(self, db: Database) -> None:
-                self.db = db
+        @container.provider(scope="singleton")
+        async def dep() -> AsyncIterator[str]:
+            async with anyio.create_task_group():
+                yield "test"
+            events.append("dep:after")
 
-        container = Container()
+        async with container:
+            assert await container.aresolve(str) == "test"
 
-        # Create without any defaults - should use cached resolver
-        instance1 = container.create(Service)
-        instance2 = container.create(Service)
+        assert events == ["dep:after"]
 
-        assert instance1.db.name == "db"
-        assert instance2.db.name == "db"
+    async def test_aclose_with_timeouts(
+        self, container: Container, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        events: list[str] = []
 
-        # Transient scope should create new instances
-        assert instance1 is not instance2
-        # But singleton dependency should be the same
-        assert instance1.db is instance2.db
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            yield "test"
+            await anyio.sleep(5)
+            events.append("dep1:after")
 
-    async def test_create_async_without_defaults(self) -> None:
-        """Test acreate without passing any defaults."""
+        @container.provider(scope="singleton")
+        def dep2() -> Iterator[int]:
+            yield 1
+            time.sleep(0.5)
+            events.append("dep2:after")
 
-        @singleton
-        class Database:
-            def __init__(self) -> None:
-                self.name = "db"
+        @container.provider(scope="singleton")
+        async def dep3() -> AsyncIterator[float]:
+            yield 1.0
+            events.append("dep3:after")
 
-        @transient
-        class Service:
-            def __init__(self, db: Database) -> None:
-                self.db = db
+        await container.astart()
 
-        container = Container()
+        with anyio.fail_after(2):
+            report = await container.aclose(timeout=0.2, timeouts={int: 0.05})
 
-        # Create without any defaults - should use cached resolver
-        instance1 = await container.acreate(Service)
-        instance2 = await container.acreate(Service)
+        assert set(report.timed_out) == {str, int}
+        assert report.slowest(1)[0].dependency_type is str
+        assert events == ["dep3:after"]
+        assert "Timed out closing resource `str`." in caplog.text
 
-        assert instance1.db.name == "db"
-        assert instance2.db.name == "db"
+    async def test_aclose_raises_after_closing_all(self, container: Container) -> None:
+        events: list[str] = []
 
-        # Transient scope should create new instances
-        assert instance1 is not instance2
-        # But singleton dependency should be the same
-        assert instance1.db is instance2.db
+        @container.provider(scope="singleton")
+        async def dep1() -> AsyncIterator[str]:
+            yield "test"
+            raise RuntimeError("failed")
 
+        @container.provider(scope="singleton")
+        async def dep2() -> AsyncIterator[int]:
+            yield 1
+            events.append("dep2:after")
 
-class TestContainerContext:
-    """Tests for container Context functionality."""
+        await container.astart()
 
-    def test_start_and_close_singleton_context(self, container: Container) -> None:
+        with pytest.raises(RuntimeError, match="failed"):
+            await container.aclose()
+
+        assert events == ["dep2:after"]
+
+    async def test_arequest_context(self, container: Container) -> None:
         events = []
 
-        def dep1() -> Iterator[str]:
+        async def dep1() -> AsyncIterator[str]:
             events.append("dep1:before")
             yield "test"
             events.append("dep1:after")
 
-        container.register(str, dep1, scope="singleton")
-
-        container.start()
-
-        assert container.resolve(str) == "test"
+        container.register(str, dep1, scope="request")
 
-        container.close()
+        async with container.arequest_context():
+            assert await container.aresolve(str) == "test"
 
         assert events == ["dep1:before", "dep1:after"]
 
-    def test_request_context(self, container: Container) -> None:
+    def test_request_context_as_decorator(self, container: Container) -> None:
         events = []
 
         def dep1() -> Iterator[str]:
@@ -2216,16 +3008,15 @@ class TestContainerContext:
 
         container.register(str, dep1, scope="request")
 
-        with container.request_context():
-            assert container.resolve(str) == "test"
-
-        assert events == ["dep1:before", "dep1:after"]
+        @container.request_context()
+        def handler() -> str:
+            return container.resolve(str)
 
-    # Asynchronous lifespan
+        assert handler() == "test"
+        assert handler() == "test"
+        assert events == ["dep1:before", "dep1:after"] * 2
 
-    async def test_astart_and_aclose_singleton_context(
-        self, container: Container
-    ) -> None:
+    async def test_ascoped_context_as_decorator(self, container: Container) -> None:
         events = []
 
         async def dep1() -> AsyncIterator[str]:
@@ -2233,30 +3024,114 @@ class TestContainerContext:
             yield "test"
             events.append("dep1:after")
 
-        container.register(str, dep1, scope="singleton")
+        container.register(str, dep1, scope="request")
 
-        await container.astart()
+        @container.ascoped_context("request")
+        async def handler() -> str:
+            return await container.aresolve(str)
 
-        assert container.resolve(str) == "test"
+        assert await handler() == "test"
+        assert await handler() == "test"
+        assert events == ["dep1:before", "dep1:after"] * 2
 
-        await container.aclose()
+    def test_request_context_is_reset_on_error(self, container: Container) -> None:
+        events = []
+
+        def dep1() -> Iterator[str]:
+            events.append("dep1:before")
+            try:
+                yield "test"
+            finally:
+                events.append("dep1:after")
+
+        container.register(str, dep1, scope="request")
+
+        def handle_request() -> None:
+            with container.request_context():
+                container.resolve(str)
+                raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            handle_request()
 
         assert events == ["dep1:before", "dep1:after"]
+        with pytest.raises(LookupError):
+            container._get_scoped_context("request")
 
-    async def test_arequest_context(self, container: Container) -> None:
+    def test_request_context_failed_event_closes_context(
+        self, container: Container
+    ) -> None:
         events = []
 
-        async def dep1() -> AsyncIterator[str]:
-            events.append("dep1:before")
+        @container.provider(scope="request")
+        def event_1() -> Iterator[None]:
+            events.append("event_1:before")
+            try:
+                yield
+            finally:
+                events.append("event_1:after")
+
+        @container.provider(scope="request")
+        def event_2() -> Iterator[None]:
+            raise RuntimeError("failed")
+            yield
+
+        with pytest.raises(RuntimeError, match="failed"):
+            with container.request_context():
+                pass
+
+        assert events == ["event_1:before", "event_1:after"]
+        with pytest.raises(LookupError):
+            container._get_scoped_context("request")
+
+    async def test_arequest_context_failed_event_closes_context(
+        self, container: Container
+    ) -> None:
+        events = []
+
+        @container.provider(scope="request")
+        async def event_1() -> AsyncIterator[None]:
+            events.append("event_1:before")
+            try:
+                yield
+            finally:
+                events.append("event_1:after")
+
+        @container.provider(scope="request")
+        async def event_2() -> AsyncIterator[None]:
+            raise RuntimeError("failed")
+            yield
+
+        with pytest.raises(RuntimeError, match="failed"):
+            async with container.arequest_context():
+                pass
+
+        assert events == ["event_1:before", "event_1:after"]
+        with pytest.raises(LookupError):
+            container._get_scoped_context("request")
+
+    def test_scope_events_are_precomputed_on_build(self, container: Container) -> None:
+        @container.provider(scope="request")
+        def event_1() -> Iterator[None]:
+            yield
+
+        @container.provider(scope="request")
+        def resource() -> Iterator[str]:
             yield "test"
-            events.append("dep1:after")
 
-        container.register(str, dep1, scope="request")
+        assert len(container._get_scope_events("request")) == 1
 
-        async with container.arequest_context():
-            assert await container.aresolve(str) == "test"
+        @container.provider(scope="request")
+        def event_2() -> Iterator[None]:
+            yield
 
-        assert events == ["dep1:before", "dep1:after"]
+        assert "request" not in container._scope_events
+
+        container.build()
+
+        events = container._scope_events["request"]
+        assert len(events) == 2
+        assert all(issubclass(event, Event) for event in events)
 
     def test_reset_resolved_instances(self, container: Container) -> None:
         container.register(str, lambda: "test", scope="singleton")
@@ -2424,6 +3299,137 @@ class TestContainerLifecycle:
     # Inspections
 
 
+class TestContainerWarmup:
+    """Tests for background creation of singletons."""
+
+    def test_warmup_creates_singletons(self, container: Container) -> None:
+        event = threading.Event()
+
+        @container.provider(scope="singleton")
+        def provide_service() -> Service:
+            event.wait(1)
+            return Service(ident="warm")
+
+        @container.provider(scope="transient")
+        def provide_resource() -> Resource:
+            return Resource()
+
+        warmup = container.warmup()
+
+        assert not warmup.done
+        assert not warmup.ready
+        assert repr(warmup).startswith("Warmup(pending")
+
+        event.set()
+
+        assert warmup.wait(1)
+        assert warmup.error is None
+        assert warmup.duration is not None
+        assert Service in warmup.dependency_types
+        assert Resource not in warmup.dependency_types
+        assert container.is_resolved(Service)
+        assert repr(warmup).startswith("Warmup(ready")
+
+    def test_warmup_selected_types(self, container: Container) -> None:
+        container.register(Service, lambda: Service(ident="a"), scope="singleton")
+        container.register(Resource, Resource, scope="singleton")
+
+        warmup = container.warmup([Resource])
+
+        assert warmup.wait(1)
+        assert warmup.dependency_types == (Resource,)
+        assert container.is_resolved(Resource)
+        assert not container.is_resolved(Service)
+
+    def test_warmup_skips_async_singletons(self, container: Container) -> None:
+        @container.provider(scope="singleton")
+        async def provide_resource() -> Resource:
+            return Resource()
+
+        @container.provider(scope="singleton")
+        def provide_service(resource: Resource) -> Service:
+            return Service(ident="a")
+
+        @container.provider(scope="singleton")
+        def provide_ident() -> str:
+            return "ident"
+
+        warmup = container.warmup()
+
+        assert warmup.wait(1)
+        assert str in warmup.dependency_types
+        assert Resource not in warmup.dependency_types
+        assert Service not in warmup.dependency_types
+
+    def test_warmup_failure(
+        self, container: Container, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        @container.provider(scope="singleton")
+        def provide_service() -> Service:
+            raise RuntimeError("boom")
+
+        with caplog.at_level(logging.ERROR, logger="anydi"):
+            warmup = container.warmup([Service])
+            assert not warmup.wait(1)
+
+        assert warmup.done
+        assert isinstance(warmup.error, RuntimeError)
+        assert repr(warmup).startswith("Warmup(failed")
+        assert "Failed to warm up singletons." in caplog.text
+
+    async def test_awarmup_in_background(self, container: Container) -> None:
+        event = anyio.Event()
+
+        @container.provider(scope="singleton")
+        async def provide_service() -> Service:
+            await event.wait()
+            return Service(ident="warm")
+
+        async with anyio.create_task_group() as tg:
+            warmup = await tg.start(container.awarmup)
+
+            assert not warmup.ready
+
+            event.set()
+
+            assert await warmup
+            assert container.is_resolved(Service)
+
+    async def test_await_warmup_from_thread(self, container: Container) -> None:
+        event = threading.Event()
+
+        @container.provider(scope="singleton")
+        def provide_service() -> Service:
+            event.wait(1)
+            return Service(ident="warm")
+
+        warmup = container.warmup([Service])
+        results: list[bool] = []
+
+        async def wait() -> None:
+            results.append(await warmup)
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(wait)
+                tg.start_soon(wait)
+                await anyio.sleep(0.01)
+                event.set()
+
+        assert results == [True, True]
+
+    async def test_awarmup_failure(self, container: Container) -> None:
+        @container.provider(scope="singleton")
+        async def provide_service() -> Service:
+            raise RuntimeError("boom")
+
+        warmup = await container.awarmup([Service])
+
+        assert warmup.done
+        assert not await warmup
+        assert isinstance(warmup.error, RuntimeError)
+
+
 class TestContainerUtilities:
     """Tests for container Utilities functionality."""
 
@@ -2884,6 +3890,20 @@ class TestContainerCustomScopes:
             context.set(TaskRequest, TaskRequest(task_id="task-123"))
             assert container.resolve(str) == "task-123"
 
+    def test_custom_scope_annotated_from_context_set_in_child_scope(
+        self, container: Container
+    ) -> None:
+        container.register_scope("task", parents=["request"])
+        container.register(Annotated[str, 1], scope="request", from_context=True)
+
+        @container.provider(scope="task")
+        def task_name(name: Annotated[str, 1]) -> str:
+            return f"task-{name}"
+
+        with container.request_context(), container.scoped_context("task") as context:
+            context.set(Annotated[str, 1], "123")
+            assert container.resolve(str) == "task-123"
+
     def test_custom_scope_nested_parent_scope_dependency(
         self, container: Container
     ) -> None:
@@ -3357,6 +4377,66 @@ class TestContainerInjector:
 
         assert result == 10
 
+    def test_inject_wrapper_preserves_metadata(self, container: Container) -> None:
+        container.register(str, lambda: "hello", scope="singleton")
+
+        def handler(message: str = Inject()) -> str:
+            """Handler docstring."""
+            return message
+
+        injected = container.inject(handler)
+
+        assert injected.__name__ == "handler"
+        assert injected.__doc__ == "Handler docstring."
+        assert injected.__wrapped__ is handler  # type: ignore[attr-defined]
+
+    def test_inject_wrapper_rebinds_after_override(self, container: Container) -> None:
+        container.register(str, lambda: "original", scope="singleton")
+
+        @container.inject
+        def handler(message: str = Inject()) -> str:
+            return message
+
+        assert handler() == "original"
+
+        with container.test_mode():
+            with container.override(str, "overridden"):
+                assert handler() == "overridden"
+            assert handler() == "original"
+
+        assert handler() == "original"
+
+    async def test_inject_async_wrapper_rebinds_after_override(
+        self, container: Container
+    ) -> None:
+        container.register(str, lambda: "original", scope="singleton")
+
+        @container.inject
+        async def handler(message: str = Inject()) -> str:
+            return message
+
+        assert await handler() == "original"
+
+        with container.test_mode(), container.override(str, "overridden"):
+            assert await handler() == "overridden"
+
+        assert await handler() == "original"
+
+    def test_inject_wrapper_rebinds_after_provider_override(
+        self, container: Container
+    ) -> None:
+        container.register(str, lambda: "original", scope="transient")
+
+        @container.inject
+        def handler(message: str = Inject()) -> str:
+            return message
+
+        assert handler() == "original"
+
+        container.register(str, lambda: "replaced", scope="transient", override=True)
+
+        assert handler() == "replaced"
+
 
 class TestContainerOverride:
     def test_override_instance(self) -> None:
@@ -1,4 +1,14 @@
-from anydi._context import InstanceContext
+import contextlib
+from collections.abc import Iterator
+from typing import Annotated
+
+import pytest
+
+from anydi import Container
+from anydi._context import ContextPool, InstanceContext, SlotTable
+from anydi._types import NOT_SET, intern_key
+
+from tests.fixtures import Service
 
 
 class TestInstanceContext:
@@ -13,3 +23,218 @@ class TestInstanceContext:
 
         assert context[int] == 42
         assert context[str] == "test_value"
+
+    def test_annotated_keys_are_interned(self) -> None:
+        context = InstanceContext()
+
+        context.set(Annotated[str, "name"], "test_value")
+
+        assert context.get(Annotated[str, "name"]) == "test_value"
+        assert Annotated[str, "name"] in context
+        assert Annotated[str, "other"] not in context
+        assert context._items == {intern_key(Annotated[str, "name"]): "test_value"}
+
+        del context[Annotated[str, "name"]]
+
+        assert Annotated[str, "name"] not in context
+
+    def test_keys_with_slots_use_slot_storage(self) -> None:
+        table = SlotTable()
+        slot = table.slot_for(intern_key(str))
+        context = InstanceContext(table)
+
+        context.set(str, "test_value")
+        context[int] = 42
+
+        assert context._slots == ["test_value"]
+        assert context._items == {int: 42}
+        assert context.get(str) == "test_value"
+        assert str in context
+
+        del context[str]
+
+        assert context._slots[slot] is NOT_SET
+        assert str not in context
+        with pytest.raises(KeyError):
+            context[str]
+
+    def test_set_slot_grows_storage(self) -> None:
+        table = SlotTable()
+        context = InstanceContext(table)
+        slot = table.slot_for(intern_key(str))
+        table.slot_for(intern_key(int))
+
+        assert context.get(str) is NOT_SET
+
+        context.set_slot(slot, "test_value")
+
+        assert context._slots == ["test_value", NOT_SET]
+        assert context.get(str) == "test_value"
+
+    def test_clear(self) -> None:
+        table = SlotTable()
+        table.slot_for(intern_key(str))
+        context = InstanceContext(table)
+        context.set(str, "test_value")
+        context.set(int, 42)
+        context.enter(contextlib.nullcontext())
+        lock = context.lock_for(str)
+        context.alock_for(str)
+        context.close()
+
+        context.clear()
+
+        assert str not in context
+        assert int not in context
+        assert context._slots == [NOT_SET]
+        assert context._stack is None
+        assert context._async_locks is None
+        assert context.lock_for(str) is lock
+
+    def test_capture(self) -> None:
+        context = InstanceContext()
+        events: list[str] = []
+
+        @contextlib.contextmanager
+        def resource(name: str) -> Iterator[None]:
+            yield
+            events.append(name)
+
+        context.enter(resource("outer"))
+        with context.capture() as stack:
+            context.enter(resource("captured"))
+
+        assert context._captures == {}
+        context.enter(resource("inner"))
+        context.enter(stack)
+        context.close()
+
+        assert events == ["captured", "inner", "outer"]
+
+    def test_enter_with_key(self) -> None:
+        context = InstanceContext()
+        events: list[str] = []
+
+        @contextlib.contextmanager
+        def resource(name: str) -> Iterator[str]:
+            yield name
+            events.append(name)
+
+        assert context.enter(resource("first"), str) == "first"
+        context.enter(resource("second"))
+
+        resources = context.take_resources()
+
+        assert list(resources) == [str]
+        assert context.take_resources() == {}
+
+        stack = resources[str]
+        assert isinstance(stack, contextlib.ExitStack)
+        stack.close()
+        context.close()
+
+        assert events == ["first", "second"]
+
+    def test_lock_for(self) -> None:
+        context = InstanceContext()
+
+        lock = context.lock_for(str)
+
+        assert context.lock_for(str) is lock
+        assert context.lock_for(int) is not lock
+
+    def test_alock_for(self) -> None:
+        context = InstanceContext()
+
+        lock = context.alock_for(str)
+
+        assert context.alock_for(str) is lock
+        assert context.alock_for(int) is not lock
+
+
+class TestSlotTable:
+    def test_slot_for_assigns_dense_slots(self) -> None:
+        table = SlotTable()
+
+        assert table.slot_for(str) == 0
+        assert table.slot_for(int) == 1
+        assert table.slot_for(str) == 0
+        assert table.get(float) is None
+        assert len(table) == 2
+
+    def test_container_assigns_slots_per_scope(self) -> None:
+        container = Container()
+        container.register(Service, scope="request", from_context=True)
+        container.register(int, lambda: 1, scope="request")
+        container.register(str, lambda: "a", scope="singleton")
+        container.register(float, lambda: 1.0, scope="transient")
+
+        table = container._slot_tables["request"]
+        assert table.get(Service) == 0
+        assert table.get(int) == 1
+        assert table.get(float) is None
+        assert container._slot_tables["singleton"].get(str) is not None
+
+        with container.request_context() as context:
+            context.set(Service, Service(ident="1"))
+
+            assert container.resolve(int) == 1
+            assert context._slots[0].ident == "1"
+            assert context._slots[1] == 1
+            assert container.resolve(Service).ident == "1"
+
+
+class TestContextPool:
+    def test_release_and_acquire(self) -> None:
+        table = SlotTable()
+        table.slot_for(intern_key(str))
+        pool = ContextPool(table, size=1)
+
+        context = pool.acquire()
+        context.set(str, "test_value")
+        pool.release(context)
+
+        assert len(pool) == 1
+
+        reused = pool.acquire()
+
+        assert reused is context
+        assert str not in reused
+        assert len(pool) == 0
+
+    def test_release_over_size(self) -> None:
+        pool = ContextPool(SlotTable(), size=1)
+        first = pool.acquire()
+        second = pool.acquire()
+
+        pool.release(first)
+        pool.release(second)
+
+        assert len(pool) == 1
+        assert pool.acquire() is first
+
+    def test_container_reuses_request_contexts(self) -> None:
+        container = Container(context_pool_size=4)
+        container.register(Service, lambda: Service(ident="1"), scope="request")
+
+        with container.request_context() as context:
+            service = container.resolve(Service)
+
+        assert Service not in context
+
+        with container.request_context() as reused:
+            assert reused is context
+            assert container.resolve(Service) is not service
+
+        assert len(container._context_pools["request"]) == 1
+
+    def test_pool_is_disabled_by_default(self) -> None:
+        container = Container()
+
+        with container.request_context() as context:
+            pass
+
+        with container.request_context() as other:
+            assert other is not context
+
+        assert container._context_pools == {}
@@ -1,15 +1,21 @@
 import asyncio
+import linecache
+import sys
+import traceback
 from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+import anyio
 import pytest
 
 import anydi._types
-from anydi import Container
+from anydi import Container, Scope
 from anydi._provider import Provider, ProviderParameter
 from anydi._resolver import InstanceProxy
 from anydi._types import NOT_SET as ANYDI_NOT_SET
 
+from tests.fixtures import UniqueId
+
 
 class TestResolver:
     def test_compile_with_removed_provider(self) -> None:
@@ -391,6 +397,26 @@ class TestResolver:
         assert resolver.override_mode is False
         assert resolver._get_override_for(int) is anydi._types.NOT_SET
 
+    def test_resolver_dispatch_follows_override_mode(self) -> None:
+        """Test that the active caches are swapped when the mode changes."""
+        container = Container()
+        resolver = container._resolver
+
+        assert resolver.dispatch is resolver._cache
+        assert resolver.async_dispatch is resolver._async_cache
+
+        with container.test_mode():
+            assert resolver.dispatch is resolver._override_cache
+            assert resolver.async_dispatch is resolver._async_override_cache
+
+        assert resolver.dispatch is resolver._cache
+
+        resolver.add_override(int, 10)
+        assert resolver.dispatch is resolver._override_cache
+
+        resolver.remove_override(int)
+        assert resolver.dispatch is resolver._cache
+
     def test_resolver_override_not_found(self) -> None:
         """Test _get_override_for when type is not in overrides."""
         container = Container()
@@ -521,3 +547,440 @@ class TestResolver:
             # Resolve via canonical should also get the override
             result2 = container.resolve(ServiceImpl)
             assert result2.get_value() == 999
+
+
+class Config:
+    pass
+
+
+class Repository:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Service:
+    def __init__(self, repository: Repository, retries: int = 3) -> None:
+        self.repository = repository
+        self.retries = retries
+
+
+class TestResolverFlatten:
+    @pytest.fixture
+    def container(self) -> Container:
+        container = Container(flatten_resolvers=True)
+        container.register(Config, scope="singleton")
+        container.register(Repository, scope="transient")
+        container.register(Service, scope="transient")
+        return container
+
+    def test_transient_chain_is_inlined(self, container: Container) -> None:
+        service = container.resolve(Service)
+        compiled = container._resolver._cache[Service]
+
+        assert "_create_instance" not in compiled.resolve.__code__.co_names
+        assert service.retries == 3
+        assert service.repository is not container.resolve(Service).repository
+
+    def test_singleton_boundary_is_cached(self, container: Container) -> None:
+        first = container.resolve(Service)
+        second = container.resolve(Service)
+
+        assert first is not second
+        assert first.repository.config is second.repository.config
+
+    async def test_async_coroutine_transient_is_inlined(self) -> None:
+        class Client:
+            def __init__(self, url: str) -> None:
+                self.url = url
+
+        container = Container(flatten_resolvers=True)
+        container.register(str, lambda: "http://localhost", scope="singleton")
+
+        @container.provider(scope="transient")
+        async def provide_client(url: str) -> Client:
+            return Client(url)
+
+        class Handler:
+            def __init__(self, client: Client) -> None:
+                self.client = client
+
+        container.register(Handler, scope="transient")
+
+        handler = await container.aresolve(Handler)
+
+        assert handler.client.url == "http://localhost"
+
+    def test_async_transient_in_sync_mode_raises(self) -> None:
+        class Handler:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        container = Container(flatten_resolvers=True)
+
+        @container.provider(scope="transient")
+        async def provide_value() -> int:
+            return 1
+
+        container.register(Handler, scope="transient")
+
+        with pytest.raises(TypeError, match="cannot be created in synchronous mode"):
+            container.resolve(Handler)
+
+    def test_create_with_defaults(self, container: Container) -> None:
+        service = container.create(Service, retries=5)
+
+        assert service.retries == 5
+
+    def test_override_mode_is_not_flattened(self, container: Container) -> None:
+        mock_repository = Repository(Config())
+        with container.test_mode(), container.override(Repository, mock_repository):
+            service = container.resolve(Service)
+
+            assert service.repository is mock_repository
+
+
+class TestResolverFoldSingletons:
+    @pytest.fixture
+    def container(self) -> Container:
+        container = Container(fold_singletons=True)
+        container.register(Config, scope="singleton")
+        container.register(Repository, scope="transient")
+        container.register(Service, scope="transient")
+        return container
+
+    def test_created_singleton_is_folded(self, container: Container) -> None:
+        config = container.resolve(Repository).config
+        assert Repository not in container._resolver._cache
+
+        repository = container.resolve(Repository)
+        compiled = container._resolver._cache[Repository]
+
+        assert compiled.create.__globals__["_folded_0"] is config
+        assert repository.config is config
+
+    def test_dependents_are_invalidated_transitively(
+        self, container: Container
+    ) -> None:
+        container.resolve(Config)
+        container.resolve(Service)
+        assert Service in container._resolver._cache
+
+        container.release(Config)
+
+        assert Repository not in container._resolver._cache
+        assert Service not in container._resolver._cache
+
+    def test_release_drops_folded_instance(self, container: Container) -> None:
+        config = container.resolve(Repository).config
+
+        container.release(Config)
+
+        assert container.resolve(Repository).config is not config
+
+    def test_reset_drops_folded_instance(self, container: Container) -> None:
+        config = container.resolve(Repository).config
+
+        container.reset()
+
+        assert container.resolve(Repository).config is not config
+
+    def test_flattened_transient_folds_singleton(self) -> None:
+        container = Container(flatten_resolvers=True, fold_singletons=True)
+        container.register(Config, scope="singleton")
+        container.register(Repository, scope="transient")
+        container.register(Service, scope="transient")
+
+        config = container.resolve(Config)
+        service = container.resolve(Service)
+        compiled = container._resolver._cache[Service]
+
+        assert service.repository.config is config
+        assert config in compiled.resolve.__globals__.values()
+
+    async def test_async_created_singleton_is_folded(self) -> None:
+        async def create_repository(config: Config) -> Repository:
+            return Repository(config)
+
+        container = Container(fold_singletons=True)
+        container.register(Config, scope="singleton")
+        container.register(Repository, create_repository, scope="transient")
+
+        config = await container.aresolve(Config)
+        await container.aresolve(Repository)
+        compiled = container._resolver._async_cache[Repository]
+
+        assert compiled.create.__globals__["_folded_0"] is config
+
+    def test_override_is_not_folded(self, container: Container) -> None:
+        container.resolve(Repository)
+        config = Config()
+
+        with container.test_mode(), container.override(Config, config):
+            assert container.resolve(Repository).config is config
+
+
+class TestResolverSyncSubgraph:
+    async def test_sync_subgraph_uses_sync_resolvers(self) -> None:
+        container = Container()
+        container.register(Config, scope="singleton")
+        container.register(Repository, scope="transient")
+        container.register(Service, scope="transient")
+
+        service = await container.aresolve(Service)
+
+        assert service.repository.config is await container.aresolve(Config)
+        assert Service in container._resolver._cache
+        assert Repository in container._resolver._cache
+
+    async def test_async_dependency_is_not_shimmed(self) -> None:
+        async def create_config() -> Config:
+            return Config()
+
+        container = Container()
+        container.register(Config, create_config, scope="singleton")
+        container.register(Repository, scope="transient")
+
+        repository = await container.aresolve(Repository)
+
+        assert isinstance(repository.config, Config)
+        assert Repository not in container._resolver._cache
+
+    async def test_context_manager_class_is_not_shimmed(self) -> None:
+        class Resource:
+            def __enter__(self) -> "Resource":
+                return self
+
+            def __exit__(self, *args: Any) -> None:
+                pass
+
+        container = Container()
+        container.register(Resource, scope="singleton")
+
+        await container.aresolve(Resource)
+
+        assert Resource not in container._resolver._cache
+
+    async def test_sync_subgraph_create(self) -> None:
+        container = Container()
+        container.register(Config, scope="singleton")
+        container.register(Repository, scope="transient")
+
+        config = Config()
+        repository = await container.acreate(Repository, config=config)
+
+        assert repository.config is config
+
+
+class TestResolverConcurrent:
+    @staticmethod
+    def register_clients(container: Container, scope: Scope) -> dict[str, int]:
+        stats = {"active": 0, "max_active": 0}
+
+        def make_factory(value: Any) -> Any:
+            async def factory() -> Any:
+                stats["active"] += 1
+                stats["max_active"] = max(stats["max_active"], stats["active"])
+                await anyio.sleep(0.01)
+                stats["active"] -= 1
+                return value
+
+            return factory
+
+        container.register(int, make_factory(1), scope=scope)
+        container.register(str, make_factory("2"), scope=scope)
+        container.register(float, make_factory(3.0), scope=scope)
+        return stats
+
+    async def test_independent_dependencies_are_resolved_concurrently(
+        self,
+    ) -> None:
+        container = Container(concurrent_resolution=True)
+        stats = self.register_clients(container, "request")
+
+        @container.provider(scope="request")
+        def create_client(a: int, b: str, c: float) -> tuple[int, str, float]:
+            return a, b, c
+
+        async with container.arequest_context():
+            assert await container.aresolve(tuple[int, str, float]) == (1, "2", 3.0)
+        assert stats["max_active"] == 3
+
+    async def test_transient_dependencies_are_resolved_concurrently(
+        self,
+    ) -> None:
+        container = Container(concurrent_resolution=True)
+        stats = self.register_clients(container, "transient")
+
+        @container.provider(scope="transient")
+        def create_client(a: int, b: str, c: float) -> tuple[int, str, float]:
+            return a, b, c
+
+        assert await container.aresolve(tuple[int, str, float]) == (1, "2", 3.0)
+        assert stats["max_active"] == 3
+
+    async def test_singleton_dependencies_are_resolved_concurrently(
+        self,
+    ) -> None:
+        container = Container(concurrent_resolution=True)
+        stats = self.register_clients(container, "singleton")
+
+        @container.provider(scope="singleton")
+        def create_client(a: int, b: str, c: float) -> tuple[int, str, float]:
+            return a, b, c
+
+        assert await container.aresolve(tuple[int, str, float]) == (1, "2", 3.0)
+        assert stats["max_active"] == 3
+
+    async def test_shared_scoped_dependency_is_created_once(
+        self,
+    ) -> None:
+        container = Container(concurrent_resolution=True)
+        calls: list[str] = []
+
+        @container.provider(scope="request")
+        async def create_session() -> list[str]:
+            calls.append("session")
+            await anyio.sleep(0.01)
+            return calls
+
+        @container.provider(scope="request")
+        async def create_users(session: list[str]) -> int:
+            return len(session)
+
+        @container.provider(scope="request")
+        async def create_orders(session: list[str]) -> str:
+            return str(len(session))
+
+        @container.provider(scope="request")
+        def create_service(users: int, orders: str) -> tuple[int, str]:
+            return users, orders
+
+        async with container.arequest_context():
+            assert await container.aresolve(tuple[int, str]) == (1, "1")
+
+        assert calls == ["session"]
+
+    async def test_single_failure_is_not_wrapped(self) -> None:
+        container = Container(concurrent_resolution=True)
+
+        @container.provider(scope="singleton")
+        async def create_int() -> int:
+            return 1
+
+        @container.provider(scope="singleton")
+        async def create_str() -> str:
+            raise ValueError("Failed to connect")
+
+        @container.provider(scope="transient")
+        def create_client(a: int, b: str) -> tuple[int, str]:
+            return a, b
+
+        with pytest.raises(ValueError, match="Failed to connect"):
+            await container.aresolve(tuple[int, str])
+
+    async def test_concurrent_dependencies_with_override(self) -> None:
+        container = Container(concurrent_resolution=True)
+        self.register_clients(container, "singleton")
+
+        @container.provider(scope="transient")
+        def create_client(a: int, b: str, c: float) -> tuple[int, str, float]:
+            return a, b, c
+
+        with container.test_mode(), container.override(str, "override"):
+            assert await container.aresolve(tuple[int, str, float]) == (
+                1,
+                "override",
+                3.0,
+            )
+
+
+class TestResolverSingleFlight:
+    @pytest.mark.parametrize("scope", ["singleton", "request"])
+    async def test_concurrent_tasks_share_one_creation(self, scope: Scope) -> None:
+        container = Container()
+        calls: list[int] = []
+
+        @container.provider(scope=scope)
+        async def provide_int() -> int:
+            calls.append(1)
+            await anyio.sleep(0.01)
+            return len(calls)
+
+        results: list[int] = []
+
+        async def resolve() -> None:
+            results.append(await container.aresolve(int))
+
+        async with container.arequest_context():
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(resolve)
+
+        assert calls == [1]
+        assert results == [1] * 5
+
+    async def test_unrelated_singletons_are_created_in_parallel(self) -> None:
+        container = Container()
+        started = anyio.Event()
+
+        @container.provider(scope="singleton")
+        async def provide_int() -> int:
+            await started.wait()
+            return 1
+
+        @container.provider(scope="singleton")
+        async def provide_str() -> str:
+            started.set()
+            return "a"
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(container.aresolve, int)
+                tg.start_soon(container.aresolve, str)
+
+        assert await container.aresolve(int) == 1
+
+
+class TestResolverCodeNames:
+    def test_generated_code_is_named_after_provider(self) -> None:
+        container = Container()
+        container.register(UniqueId, scope="transient")
+
+        container.resolve(UniqueId)
+
+        code = container._resolver._cache[UniqueId].resolve.__code__
+        assert code.co_filename.startswith("<anydi:tests.fixtures.UniqueId:sync:")
+        if sys.version_info >= (3, 11):
+            assert code.co_qualname == "tests.fixtures.UniqueId._resolver"
+
+    async def test_async_code_is_named_after_provider(self) -> None:
+        container = Container()
+
+        @container.provider(scope="transient")
+        async def provide_unique_id() -> UniqueId:
+            return UniqueId()
+
+        await container.aresolve(UniqueId)
+
+        code = container._resolver._async_cache[UniqueId].resolve.__code__
+        assert code.co_filename.startswith("<anydi:tests.fixtures.UniqueId:async:")
+
+    def test_traceback_shows_generated_source(self) -> None:
+        container = Container()
+
+        @container.provider(scope="transient")
+        def provide_unique_id() -> UniqueId:
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError, match="failed") as exc_info:
+            container.resolve(UniqueId)
+
+        entries = [
+            entry
+            for entry in traceback.extract_tb(exc_info.value.__traceback__)
+            if entry.filename.startswith("<anydi:")
+        ]
+        assert entries
+        assert all(entry.line for entry in entries)
+        assert entries[-1].lineno is not None
+        assert linecache.getline(entries[-1].filename, entries[-1].lineno)
@@ -1,4 +1,13 @@
-from anydi._types import NOT_SET, to_list
+import gc
+from typing import Annotated
+
+from anydi._types import (
+    NOT_SET,
+    DependencyKey,
+    _dependency_keys,
+    intern_key,
+    to_list,
+)
 
 
 def test_to_list_none() -> None:
@@ -20,3 +29,42 @@ def test_to_list_list() -> None:
 
 def test_to_list_tuple() -> None:
     assert to_list((1, 2, 3)) == [1, 2, 3]
+
+
+def test_intern_key_class() -> None:
+    assert intern_key(int) is int
+
+
+def test_intern_key_annotated() -> None:
+    key = intern_key(Annotated[int, "qualifier"])
+
+    assert isinstance(key, DependencyKey)
+    assert key is intern_key(Annotated[int, "qualifier"])
+    assert key is not intern_key(Annotated[int, "other"])
+    assert key.dependency_type == Annotated[int, "qualifier"]
+    assert repr(key) == "DependencyKey(typing.Annotated[int, 'qualifier'])"
+
+
+def test_intern_key_is_idempotent() -> None:
+    key = intern_key(Annotated[str, 1])
+
+    assert intern_key(key) is key
+
+
+def test_intern_key_generic_alias() -> None:
+    key = intern_key(list[int])
+
+    assert isinstance(key, DependencyKey)
+    assert key is intern_key(list[int])
+
+
+def test_intern_key_dropped_when_unreferenced() -> None:
+    marker = object()
+    key = intern_key(Annotated[int, marker])
+
+    assert _dependency_keys[Annotated[int, marker]] is key
+
+    del key
+    gc.collect()
+
+    assert Annotated[int, marker] not in _dependency_keys